@@ -1,7 +1,20 @@
+import hashlib
 import streamlit as st
+import numpy as np
 import pandas as pd
-import joblib
-from pathlib import Path
+
+from src.mnc_probability_analyzer.artifact import artifact_path
+from src.mnc_probability_analyzer.batch import split_valid
+from src.mnc_probability_analyzer.cli import load_model
+from src.mnc_probability_analyzer.counterfactual import response_surface, what_it_takes
+from src.mnc_probability_analyzer.dataio import read_bytes
+from src.mnc_probability_analyzer.engine import load_fused
+from src.mnc_probability_analyzer.formulas import trained_features
+from src.mnc_probability_analyzer.suggestions import readiness_tier, render_codes, student_advice, suggestion_codes
+
+MODELS_DIR = "models"
+# Rows scored per step on the cohort page; keeps the progress bar moving on large uploads
+COHORT_CHUNK = 5000
 
 # Set page config
 st.set_page_config(
@@ -14,17 +27,81 @@ st.set_page_config(
 st.title("🎯 MNC Placement Probability Analyzer")
 st.markdown("### Predict your readiness for top MNC placements")
 
-# Company selection
-companies = {
-    'Google': ['CGPA', 'Total Problems Solved', 'LeetCode Solved'],
-    'Microsoft': ['Technical Projects', 'Internships', 'Certifications', 'Total Problems Solved', 'Total Skills'],
-    'Amazon': ['Technical Projects', 'Internships', 'Certifications', 'LeetCode Solved', 'Teamwork Experience'],
-    'Infosys': ['Internships', 'Technical Projects', 'Certifications', 'LeetCode Solved', 'Teamwork Experience']
-}
+# Company selection: the companies and features the saved models were trained on
+companies = trained_features(MODELS_DIR)
+
+
+def models_stamp(models_dir: str):
+    # Changes whenever a model is retrained, which invalidates the cached resources below
+    paths = [artifact_path(models_dir, c) for c in companies]
+    return tuple(p.stat().st_mtime_ns if p.exists() else None for p in paths)
+
+
+@st.cache_resource(show_spinner=False)
+def load_engine(models_dir: str, stamp: tuple):
+    # Loaded once per server process and shared by every session
+    return load_fused(models_dir, companies)
+
+
+@st.cache_resource(show_spinner=False)
+def company_vector(models_dir: str, stamp: tuple, company: str):
+    # Precomputed coefficients in slider order, so a rerun costs one dot product.
+    # Read from the company's own artifact, so other companies' models are not needed.
+    model, feats = load_model(models_dir, company)
+    coef = dict(zip(feats, np.ravel(model.coef_)))
+    return np.array([coef.get(f, 0.0) for f in companies[company]]), float(np.ravel(model.intercept_)[0])
+
+
+@st.cache_data(show_spinner="Reading file...", max_entries=4)
+def parse_upload(data: bytes, name: str):
+    # Parsed once per distinct file; reruns for paging reuse the result
+    return read_bytes(data, name)
+
+
+def score_cohort(engine, df: pd.DataFrame):
+    valid, rejects = split_valid(df, engine.features)
+    X = engine.design_matrix(valid)
+    scores = np.empty((len(X), len(engine.companies)))
+    progress = st.progress(0.0, text="Scoring cohort...")
+    for start in range(0, len(X), COHORT_CHUNK):
+        scores[start:start + COHORT_CHUNK] = engine.predict(X[start:start + COHORT_CHUNK])
+        progress.progress(min(1.0, (start + COHORT_CHUNK) / max(len(X), 1)), text=f"Scored {min(start + COHORT_CHUNK, len(X))} of {len(X)} students")
+    progress.empty()
+    readiness = pd.DataFrame(scores, index=valid.index, columns=[f"{c}_Readiness" for c in engine.companies])
+    return pd.concat([valid.drop(columns=readiness.columns, errors='ignore'), readiness], axis=1), rejects
+
+
+def slider_spec(feature: str):
+    # Set default values and min/max based on feature: (min, max, default, step)
+    if feature == 'CGPA':
+        return 0.0, 10.0, 8.0, 0.1
+    if feature in ['10th %', '12th %']:
+        return 0.0, 100.0, 75.0, 0.5
+    if feature in ['Total Problems Solved', 'LeetCode Solved']:
+        return 0, 1000, 100, 1
+    if feature in ['Technical Projects', 'Internships', 'Certifications', 'Total Skills', 'Teamwork Experience']:
+        return 0, 50, 5, 1
+    return 0, 10, 0, 1
+
+
+# Grid points per axis for the what-if charts (one feature, two features)
+WHAT_IF_POINTS = {1: 201, 2: 61}
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def what_if_grid(models_dir: str, stamp: tuple, company: str, axes: tuple, fixed: tuple):
+    # LRU keyed by company and the values of the features that are *not* on the grid,
+    # so dragging a gridded feature's slider reuses the surface instead of re-scoring
+    weights, intercept = company_vector(models_dir, stamp, company)
+    feats = companies[company]
+    x = [dict(fixed).get(f, 0.0) for f in feats]
+    grids = [np.linspace(*slider_spec(a)[:2], WHAT_IF_POINTS[len(axes)]) for a in axes]
+    return grids, response_surface(weights, intercept, x, [feats.index(a) for a in axes], grids)
+
 
 # Sidebar for navigation
 st.sidebar.title("Navigation")
-page = st.sidebar.radio("Go to", ["Home", "How It Works"])
+page = st.sidebar.radio("Go to", ["Home", "Cohort Upload", "How It Works"])
 
 if page == "Home":
     # Company selection
@@ -39,23 +116,7 @@ if page == "Home":
     # Create input fields for each feature
     input_data = {}
     for feature in companies[selected_company]:
-        # Set default values and min/max based on feature
-        min_val = 0
-        max_val = 10
-        step = 0.1 if feature == 'CGPA' else 1
-        value = 0.0 if feature == 'CGPA' else 0
-        
-        if feature == 'CGPA':
-            min_val = 0.0
-            max_val = 10.0
-            value = 8.0  # Default CGPA
-        elif feature in ['Total Problems Solved', 'LeetCode Solved']:
-            max_val = 1000
-            value = 100
-        elif feature in ['Technical Projects', 'Internships', 'Certifications', 'Total Skills', 'Teamwork Experience']:
-            max_val = 50
-            value = 5
-        
+        min_val, max_val, value, step = slider_spec(feature)
         input_data[feature] = st.slider(
             label=f"{feature}:",
             min_value=min_val,
@@ -65,24 +126,20 @@ if page == "Home":
             help=f"Enter your {feature}"
         )
 
-    # Predict button
-    if st.button("Predict My Readiness"):
+    # Live mode re-scores on every slider change; otherwise wait for the button
+    live = st.toggle("Live mode (update the score as you move the sliders)")
+    if st.button("Predict My Readiness") or live:
         try:
-            # Load the model
-            model_path = Path(f"models/{selected_company.lower()}.joblib")
-            if not model_path.exists():
+            stamp = models_stamp(MODELS_DIR)
+            if stamp[list(companies).index(selected_company)] is None:
                 st.error(f"Model for {selected_company} not found. Please train the model first.")
             else:
-                model_data = joblib.load(model_path)
-                model = model_data['model']
-                
-                # Prepare input data
-                input_df = pd.DataFrame([input_data])
-                
+                weights, intercept = company_vector(MODELS_DIR, stamp, selected_company)
+
                 # Make prediction
-                prediction = model.predict(input_df)[0]
-                probability = max(0.0, min(1.0, float(prediction))) * 100
-                
+                x = np.array([input_data[f] for f in companies[selected_company]], dtype=float)
+                probability = float(np.clip(weights @ x + intercept, 0.0, 1.0)) * 100
+
                 # Display result
                 st.success("### 🎯 Your Results")
                 
@@ -93,37 +150,106 @@ if page == "Home":
                 )
                 st.progress(int(probability) / 100)
                 
-                # Suggestions based on score
+                # Suggestions from the shared rule engine (same as the CLI)
                 st.subheader("📝 Suggestions")
-                if probability < 30:
-                    st.warning("### Areas to Improve:")
-                    st.markdown("""
-                    - Focus on core DSA and problem-solving
-                    - Work on personal projects
-                    - Consider getting certifications
-                    - Practice coding on platforms like LeetCode
-                    """)
-                elif probability < 60:
-                    st.info("### You're on the right track!")
-                    st.markdown("""
-                    - Practice more coding problems
-                    - Consider an internship
-                    - Work on team projects
-                    - Improve your problem-solving speed
-                    """)
-                else:
-                    st.success("### Great job! Keep it up!")
-                    st.markdown("""
-                    - Prepare for behavioral interviews
-                    - Practice system design
-                    - Keep solving challenging problems
-                    - Network with professionals
-                    """)
+                title, tips = student_advice(selected_company, probability / 100, input_data)
+                box = [st.warning, st.info, st.success][int(readiness_tier(probability / 100))]
+                box(f"### {title}")
+                st.markdown("\n".join(f"- {tip}" for tip in tips))
+
+                # Closed-form answer to "how much more do I need?"; the model is linear in every input
+                with st.expander("🎯 What it takes to reach a target score"):
+                    target = st.slider("Target readiness (%)", 1, 100, 60)
+                    feats = companies[selected_company]
+                    single, plan, gap = what_it_takes(x, weights, intercept, target / 100, feats)
+                    if gap[0] == 0:
+                        st.success(f"You already reach {target}% at {selected_company}.")
+                    elif np.isnan(plan[0]).all():
+                        st.warning(f"{target}% at {selected_company} is out of reach even with every feature at its maximum.")
+                    else:
+                        st.dataframe(pd.DataFrame({
+                            "Feature": feats,
+                            "Current": x,
+                            "Raise this one only": single[0],
+                            "Or combine": plan[0],
+                        }).style.format({"Current": "{:g}", "Raise this one only": "{:+.2f}", "Or combine": "{:+.2f}"}, na_rep="not enough alone"),
+                            hide_index=True)
+                        st.caption("The combined plan spreads the change by effort "
+                                   "(e.g. 0.5 CGPA counts like 50 more problems solved). "
+                                   "Turn on live mode to move the target without pressing Predict again.")
                 
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
             st.info("Please make sure you have trained the models first by running 'python -m src.mnc_probability_analyzer.train'")
 
+    with st.expander("📈 What-if explorer"):
+        axes = st.multiselect("Vary one or two features", companies[selected_company],
+                              default=companies[selected_company][:1], max_selections=2)
+        stamp = models_stamp(MODELS_DIR)
+        if axes and stamp[list(companies).index(selected_company)] is not None:
+            fixed = tuple((f, float(v)) for f, v in input_data.items() if f not in axes)
+            # Same guard as the prediction above: one unreadable artifact must not take the page down
+            try:
+                grids, surface = what_if_grid(MODELS_DIR, stamp, selected_company, tuple(axes), fixed)
+            except Exception as e:
+                st.error(f"Could not chart {selected_company}: {e}")
+            else:
+                if len(axes) == 1:
+                    chart = pd.DataFrame({axes[0]: grids[0], "Readiness %": surface * 100}).set_index(axes[0])
+                    st.line_chart(chart, y_label="Readiness %")
+                else:
+                    a, b = np.meshgrid(grids[0], grids[1], indexing="ij")
+                    chart = pd.DataFrame({"x": a.ravel(), "y": b.ravel(), "Readiness %": surface.ravel() * 100})
+                    st.vega_lite_chart(chart, {
+                        "mark": {"type": "rect"},
+                        "encoding": {
+                            "x": {"field": "x", "type": "quantitative", "bin": {"maxbins": WHAT_IF_POINTS[2]}, "title": axes[0]},
+                            "y": {"field": "y", "type": "quantitative", "bin": {"maxbins": WHAT_IF_POINTS[2]}, "title": axes[1]},
+                            "color": {"field": "Readiness %", "type": "quantitative", "aggregate": "mean"},
+                        },
+                    }, width="stretch")
+                st.caption("Other features are held at your slider values. You are at "
+                           + ", ".join(f"{f} = {input_data[f]:g}" for f in axes) + ".")
+
+elif page == "Cohort Upload":
+    st.subheader("Score a whole class for every company")
+    upload = st.file_uploader("Upload a class spreadsheet", type=["csv", "xlsx", "parquet"],
+                              help="One row per student with columns: " + ", ".join(dict.fromkeys(f for fs in companies.values() for f in fs)))
+
+    if upload is not None:
+        try:
+            data = upload.getvalue()
+            key = (hashlib.sha256(data).hexdigest(), models_stamp(MODELS_DIR))
+            # Scores are kept per session so paging and downloads do not re-score
+            if st.session_state.get("cohort_key") != key:
+                engine = load_engine(MODELS_DIR, key[1])
+                results, rejects = score_cohort(engine, parse_upload(data, upload.name))
+                # Suggestions stay as compact codes; text is rendered for the visible page and the download
+                codes = suggestion_codes(results)
+                csv_bytes = results.assign(Suggested_Improvements=render_codes(codes)).to_csv(index=False).encode("utf-8")
+                st.session_state.cohort_key = key
+                st.session_state.cohort = (results, codes, rejects, csv_bytes)
+            results, codes, rejects, csv_bytes = st.session_state.cohort
+
+            st.success(f"Scored {len(results)} students for {len(load_engine(MODELS_DIR, key[1]).companies)} companies")
+            if len(rejects):
+                with st.expander(f"{len(rejects)} rows skipped because of missing or invalid values"):
+                    st.dataframe(rejects, hide_index=True)
+
+            col1, col2 = st.columns(2)
+            page_size = col1.selectbox("Rows per page", [25, 50, 100, 500], index=1)
+            pages = max(1, -(-len(results) // page_size))
+            page_no = col2.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1)
+            rows = slice((page_no - 1) * page_size, page_no * page_size)
+            shown = results.iloc[rows].assign(Suggested_Improvements=render_codes(codes[rows]))
+            readiness_cols = [c for c in shown.columns if c.endswith("_Readiness")]
+            st.dataframe(shown.style.format({c: "{:.1%}" for c in readiness_cols}), hide_index=True)
+
+            st.download_button("Download scores (CSV)", csv_bytes, file_name="cohort_scores.csv", mime="text/csv")
+        except Exception as e:
+            st.error(f"An error occurred: {str(e)}")
+            st.info("Please make sure you have trained the models first by running 'python -m src.mnc_probability_analyzer.train'")
+
 else:  # How It Works page
     st.header("How It Works")
     st.markdown("""
@@ -139,7 +265,7 @@ else:  # How It Works page
     ### 🚀 Getting Started
     1. Select a company from the dropdown
     2. Enter your details in the input fields
-    3. Click "Predict My Readiness" to see your score
+    3. Click "Predict My Readiness" to see your score, or switch on live mode to see it update as you move the sliders
     
     ### ⚙️ Technical Details
     - Uses Linear Regression models trained on historical data
@@ -0,0 +1,51 @@
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.mnc_probability_analyzer.preprocess import count_skills
+
+
+def count_skills_apply(series):
+    # Previous per-row implementation, kept as the reference
+    return series.fillna('').astype(str).apply(
+        lambda x: len([s.strip() for s in x.split(',') if s.strip()])
+    )
+
+
+def make_skills(n: int, seed: int = 42) -> pd.Series:
+    # Survey-like answers: lists of skills with stray spaces, empty and blank entries
+    rng = np.random.default_rng(seed)
+    vocab = np.array(['Python', 'Java', ' C++', 'SQL ', '  ML', 'DSA', 'React', 'Cloud', '', ' ', ' ', 'Git\t'])
+    k = rng.integers(0, 7, n)
+    picks = rng.integers(0, len(vocab), k.sum())
+    bounds = np.cumsum(k)[:-1]
+    values = [','.join(p) for p in np.split(vocab[picks], bounds)]
+    series = pd.Series(values, dtype=object)
+    series[rng.random(n) < 0.05] = None
+    return series
+
+
+def timed(fn, series, repeat: int):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(series)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the vectorized and per-row skill counters.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Number of generated answers')
+    parser.add_argument('--repeat', type=int, default=3, help='Best-of-N timing')
+    args = parser.parse_args()
+
+    series = make_skills(args.rows)
+    t_apply, expected = timed(count_skills_apply, series, args.repeat)
+    t_vec, actual = timed(count_skills, series, args.repeat)
+    assert (expected.to_numpy() == actual.to_numpy()).all(), 'vectorized counts differ from the reference'
+
+    print(f"rows={args.rows}")
+    print(f"apply:      {t_apply:.3f}s")
+    print(f"vectorized: {t_vec:.3f}s  ({t_apply / t_vec:.1f}x faster)")
@@ -0,0 +1,229 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import sklearn
+
+from benchmarks.count_skills import make_skills
+from src.mnc_probability_analyzer import cli, profiling
+from src.mnc_probability_analyzer.dataio import read_table
+from src.mnc_probability_analyzer.engine import load_fused
+from src.mnc_probability_analyzer.formulas import trained_features
+from src.mnc_probability_analyzer.generate_dummy import generate_dummy
+from src.mnc_probability_analyzer.preprocess import add_readiness, count_skills, fit_scaling, preprocess
+from src.mnc_probability_analyzer.registry import registry
+from src.mnc_probability_analyzer.train import train_and_save_models
+
+try:
+    import resource
+except ImportError:  # Windows: no RSS figures
+    resource = None
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def _reset_peak_rss() -> bool:
+    # Linux lets a process reset its own RSS high-water mark, which gives a
+    # per-stage peak; elsewhere only the process-lifetime peak is available
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _rss():
+    # (current, peak) resident set size in bytes, None when unknown. RSS also
+    # counts Arrow/parquet buffers, which tracemalloc does not see.
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return int(fields['VmRSS'].split()[0]) * 1024, int(fields['VmHWM'].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        if resource is None:
+            return None, None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return None, peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Recorder:
+    # Times one stage at a time and records the process RSS before it and at its peak
+
+    def __init__(self, rows: int):
+        self.rows = rows
+        self.results = []
+
+    def run(self, stage: str, fn, calls: int = 1):
+        per_stage = _reset_peak_rss()
+        rss_before, _ = _rss()
+        start = time.perf_counter()
+        for _ in range(calls):
+            out = fn()
+        seconds = time.perf_counter() - start
+        _, peak = _rss()
+        self.results.append({'rows': self.rows, 'stage': stage, 'seconds': seconds / calls, 'calls': calls,
+                             'rss_before_bytes': rss_before, 'peak_rss_bytes': peak, 'peak_is_per_stage': per_stage})
+        shown = f"{peak / 2**20:9.1f} MiB" if peak is not None else '      n/a'
+        print(f"  {stage:<16} {seconds / calls:10.6f}s  peak RSS={shown}")
+        return out
+
+    def add(self, stage: str, seconds: float, peak: int = None):
+        # A sub-stage measured by the package profiler inside a timed stage; its
+        # peak RSS is the process high-water mark when the sub-stage ended
+        self.results.append({'rows': self.rows, 'stage': stage, 'seconds': seconds, 'calls': 1,
+                             'rss_before_bytes': None, 'peak_rss_bytes': peak, 'peak_is_per_stage': False})
+        print(f"    {stage:<20} {seconds:10.6f}s")
+
+    def run_profiled(self, stage: str, fn, trace_path: Path):
+        # Runs a pipeline entry point with --profile style tracing and adds its
+        # read/labels/fit/save stages, summed over companies, as '<stage>:<name>'
+        with profiling.profile_run(str(trace_path)) as profiler:
+            out = self.run(stage, fn)
+        totals, peaks = {}, {}
+        for r in profiler.stages:
+            key = r['name'].split(':')[0]
+            totals[key] = totals.get(key, 0.0) + r['wall_seconds']
+            peaks[key] = max(peaks.get(key) or 0, r['peak_rss_bytes'] or 0) or None
+        if 'train' in totals:
+            # The batched solve has no per-company fit stages and --jobs fits in
+            # workers the profiler cannot see, so fit is what the train stage spent outside saves
+            inner = totals.pop('train') - totals.get('save', 0.0)
+            if 'fit' not in totals:
+                key = 'fit' if 'save' in totals else 'fit_and_save'
+                totals[key], peaks[key] = inner, peaks['train']
+        for key, seconds in totals.items():
+            self.add(f"{stage}:{key}", seconds, peaks.get(key))
+        return out
+
+
+def _quiet(fn, *args, **kwargs):
+    # The entry points print their metrics; keep the benchmark output to the timings
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def make_raw(df: pd.DataFrame) -> pd.DataFrame:
+    # Survey-export shaped input for preprocess(): names and free-text skill
+    # answers next to the raw numeric columns
+    raw = df.drop(columns=['Total Skills'], errors='ignore').copy()
+    raw.insert(0, 'Full Name', [f"Student {i}" for i in range(len(raw))])
+    raw['Which technical skills do you have?'] = make_skills(len(raw), seed=1)
+    raw['Other skills: '] = make_skills(len(raw), seed=2)
+    return raw
+
+
+def bench_size(n: int, workdir: Path, predict_calls: int, jobs: int) -> list:
+    rec = Recorder(n)
+    data_path = workdir / f"bench_{n}.parquet"
+
+    rec.run('generate', lambda: _quiet(generate_dummy, str(data_path), n))
+    df = rec.run('read', lambda: read_table(data_path))
+
+    # The whole preprocess() entry point on a raw CSV export, with its own stages
+    raw_path = workdir / f"raw_{n}.csv"
+    make_raw(df).to_csv(raw_path, index=False)
+    rec.run_profiled('preprocess', lambda: _quiet(preprocess, str(raw_path), str(workdir / f"processed_{n}.parquet")),
+                     workdir / f"preprocess_{n}.trace.json")
+    raw_path.unlink()
+
+    skills = make_skills(n)
+    rec.run('skill_count', lambda: count_skills(skills))
+    del skills
+
+    scaled = df.copy()
+    rec.run('scaling', lambda: fit_scaling(scaled))
+    rec.run('readiness', lambda: add_readiness(scaled))
+    del scaled
+
+    # The public training entry point end to end (read, seeded labels, split,
+    # fit, statistics and artifact saves), with fit and save also reported on
+    # their own. Each variant gets its own models directory, so none of them
+    # reuses another one's label cache.
+    variants = {'train': {}, 'train_jobs': {'jobs': jobs}, 'train_batched': {'batched': True}}
+    for stage, options in variants.items():
+        rec.run_profiled(stage, lambda: _quiet(train_and_save_models, str(data_path), str(workdir / f"{stage}_{n}"),
+                                               seed=0, **options),
+                         workdir / f"{stage}_{n}.trace.json")
+    models_dir = workdir / f"train_{n}"
+
+    def load_cold():
+        registry.clear()
+        return [cli.load_model(str(models_dir), name) for name in trained_features(models_dir)]
+    rec.run('load', load_cold)
+
+    # The CLI path: one-row DataFrame per student and company
+    model, feats = cli.load_model(str(models_dir), 'Google')
+    row = df[feats].iloc[0].to_dict()
+    rec.run('predict_single', lambda: model.predict(pd.DataFrame([row]))[0], calls=min(predict_calls, n))
+
+    engine = load_fused(str(models_dir), trained_features(models_dir))
+    rec.run('predict_batch', lambda: engine.predict_frame(df))
+    return rec.results
+
+
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    # Stages that got slower than the baseline by more than the tolerance
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['rows'], r['stage']): r for r in json.load(f)['results']}
+    regressions = []
+    for r in results:
+        old = baseline.get((r['rows'], r['stage']))
+        if old and old['seconds'] > 0 and r['seconds'] > old['seconds'] * (1 + tolerance):
+            regressions.append({**r, 'baseline_seconds': old['seconds'], 'ratio': r['seconds'] / old['seconds']})
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time and memory-profile each pipeline stage at several dataset sizes.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Row counts to benchmark')
+    parser.add_argument('--output', default='bench_results.json', help='Where to write the JSON results')
+    parser.add_argument('--predict-calls', type=int, default=1000, help='Single-row predictions to average over')
+    parser.add_argument('--jobs', type=int, default=min(4, os.cpu_count() or 1), help='Processes for the train_jobs stage')
+    parser.add_argument('--baseline', help='Earlier results JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed slowdown vs. the baseline (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            print(f"rows={n}")
+            results.extend(bench_size(n, Path(tmp), args.predict_calls, args.jobs))
+
+    report = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'sklearn': sklearn.__version__,
+            'memory': 'peak_rss_bytes is the process resident set size high-water mark, reset before each stage '
+                      'where peak_is_per_stage is true (Linux) and process-lifetime otherwise; it includes Arrow buffers',
+            'substages': "'<stage>:<name>' rows are that stage's --profile stages summed over companies; "
+                         "fit is the train stage minus saves where fits are not recorded per company",
+        },
+        'results': results,
+    }
+    if args.baseline:
+        report['regressions'] = compare(results, args.baseline, args.tolerance)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} measurements to {args.output}")
+
+    if report.get('regressions'):
+        for r in report['regressions']:
+            print(f"REGRESSION rows={r['rows']} {r['stage']}: {r['baseline_seconds']:.6f}s -> {r['seconds']:.6f}s")
+        sys.exit(1)
@@ -30,6 +30,7 @@ print(df.columns.tolist())
 
 print(df.shape)
 
+import re
 import pandas as pd
 
 
@@ -38,9 +39,14 @@ other_col = 'Other skills: '
 
 if tech_col in df.columns and other_col in df.columns:
 
+    # Every character str.isspace() accepts, spelled out: with pandas' Arrow-backed
+    # strings \s would only match ASCII whitespace (same pattern as preprocess.count_skills)
+    whitespace = re.escape('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+                           '\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+
     def count_skills(series):
-        return series.fillna('').astype(str)\
-                     .apply(lambda x: len([s.strip() for s in x.split(',') if s.strip()]))
+        # Count comma-separated entries that are not blank
+        return series.fillna('').astype(str).str.count(f"[^,{whitespace}][^,]*")
 
 
     df['Total Skills'] = count_skills(df[tech_col]) + count_skills(df[other_col])
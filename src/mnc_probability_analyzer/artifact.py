@@ -0,0 +1,76 @@
+import hashlib
+import json
+from pathlib import Path
+import numpy as np
+
+
+FORMAT_VERSION = 1
+
+
+def _checksum(coef: np.ndarray, intercept: float, features) -> str:
+    h = hashlib.sha256()
+    h.update(np.ascontiguousarray(coef, dtype='<f8').tobytes())
+    h.update(np.asarray(intercept, dtype='<f8').tobytes())
+    h.update(json.dumps(list(features)).encode('utf-8'))
+    return h.hexdigest()
+
+
+class LinearArtifact:
+    # NumPy-only stand-in for a fitted LinearRegression. Exposes coef_/intercept_
+    # and predict() so it drops in wherever the sklearn model was used.
+
+    def __init__(self, features, coef, intercept, metadata=None):
+        self.features = list(features)
+        self.coef_ = np.asarray(coef, dtype=float)
+        self.intercept_ = float(intercept)
+        self.metadata = dict(metadata or {})
+
+    def predict(self, X) -> np.ndarray:
+        if hasattr(X, 'columns'):
+            X = X[self.features]
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        return X @ self.coef_ + self.intercept_
+
+
+def save_compact(path, features, coef, intercept, metadata=None) -> None:
+    coef = np.ravel(np.asarray(coef, dtype=float))
+    intercept = float(np.ravel(intercept)[0])
+    header = {
+        'format_version': FORMAT_VERSION,
+        'features': list(features),
+        'metadata': dict(metadata or {}),
+        'checksum': _checksum(coef, intercept, features),
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        np.savez(f, coef=coef, intercept=np.array(intercept),
+                 header=np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8))
+
+
+def load_compact(path) -> LinearArtifact:
+    with np.load(path, allow_pickle=False) as data:
+        header = json.loads(data['header'].tobytes().decode('utf-8'))
+        coef = data['coef']
+        intercept = float(data['intercept'])
+    if header.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact format {header.get('format_version')} in {path}")
+    if _checksum(coef, intercept, header['features']) != header['checksum']:
+        raise ValueError(f"Checksum mismatch in {path}; the artifact is corrupt")
+    return LinearArtifact(header['features'], coef, intercept, header['metadata'])
+
+
+def load_artifact(path) -> dict:
+    # Same {'model', 'features'} shape for both formats; joblib (and with it
+    # sklearn) is only imported when a pickled artifact is actually read
+    if Path(path).suffix == '.npz':
+        model = load_compact(path)
+        return {'model': model, 'features': model.features}
+    import joblib
+    return joblib.load(path)
+
+
+def artifact_path(models_dir, company: str) -> Path:
+    # Prefer the compact artifact when train.py has written one
+    base = Path(models_dir) / company.lower()
+    compact = base.with_suffix('.npz')
+    return compact if compact.exists() else base.with_suffix('.joblib')
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+
+def split_valid(df: pd.DataFrame, features):
+    # Coerce required columns to numbers; anything missing or non-numeric rejects the row
+    values = pd.DataFrame(index=df.index)
+    reasons = pd.Series('', index=df.index, dtype=object)
+    for f in features:
+        if f in df.columns:
+            col = pd.to_numeric(df[f], errors='coerce')
+            bad = col.isna()
+            if bad.any():
+                label = np.where(df[f].isna(), f"missing {f}", f"invalid {f}")
+                reasons[bad] = reasons[bad] + '; ' + pd.Series(label, index=df.index)[bad]
+        else:
+            col = pd.Series(np.nan, index=df.index)
+            reasons = reasons + f"; missing column {f}"
+        values[f] = col
+
+    rejected = reasons != ''
+    valid = df.loc[~rejected].copy()
+    valid[list(features)] = values.loc[~rejected, list(features)]
+    rejects = df.loc[rejected].copy()
+    rejects.insert(0, 'Reason', reasons[rejected].str.lstrip('; '))
+    rejects.insert(0, 'Row', rejects.index)
+    return valid, rejects
+
@@ -1,30 +1,124 @@
 import argparse
+import json
+import os
+import socket
+import tempfile
 from pathlib import Path
-import joblib
-import pandas as pd
 
+from . import profiling
+from .formulas import trained_features
 
-FEATURES = {
-    'Google':   ['CGPA', 'Total Problems Solved', 'LeetCode Solved'],
-    'Microsoft':['Technical Projects', 'Internships', 'Certifications', 'Total Problems Solved', 'Total Skills'],
-    'Amazon':   ['Technical Projects', 'Internships', 'Certifications', 'LeetCode Solved', 'Teamwork Experience'],
-    'Infosys':  ['Internships', 'Technical Projects', 'Certifications', 'LeetCode Solved', 'Teamwork Experience'],
-}
+# pandas, NumPy and the model code are imported inside the functions that need
+# them, so a call answered by the warm daemon stays cheap to start
 
 
 def load_model(models_dir: str, company: str):
-    path = Path(models_dir) / f"{company.lower()}.joblib"
-    obj = joblib.load(path)
+    from .artifact import artifact_path
+    from .registry import get_model
+    obj = get_model(artifact_path(models_dir, company))
     return obj['model'], obj['features']
 
 
+def default_socket_path() -> str:
+    uid = os.getuid() if hasattr(os, 'getuid') else 'user'
+    return os.environ.get('MNC_ANALYZER_SOCKET', str(Path(tempfile.gettempdir()) / f"mnc-analyzer-{uid}.sock"))
+
+
+def daemon_predict(socket_path: str, models_dir: str, company: str, data: dict, timeout: float = 2.0):
+    # Readiness in [0, 1] from a running --serve daemon, or None when there is
+    # no daemon (or it serves another models_dir) so the caller scores in-process
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            request = {'models_dir': str(Path(models_dir).resolve()), 'company': company, 'features': data}
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as f:
+                response = json.loads(f.readline() or b'{}')
+    except (OSError, ValueError):
+        return None
+    return response.get('readiness')
+
+
+def predict_in_process(models_dir: str, company: str, data: dict) -> float:
+    import pandas as pd
+    with profiling.stage('load_model'):
+        model, feats = load_model(models_dir, company)
+    with profiling.stage('predict', rows=1):
+        pred = model.predict(pd.DataFrame([data])[feats])[0]
+    return max(0.0, min(1.0, float(pred)))
+
+
+def print_what_it_takes(models_dir: str, company: str, data: dict, target_pct: float) -> None:
+    import numpy as np
+    from .counterfactual import what_it_takes
+    model, feats = load_model(models_dir, company)
+    x = [data[f] for f in feats]
+    single, plan, gap = what_it_takes([x], model.coef_, float(model.intercept_), target_pct / 100, feats)
+    if gap[0] == 0:
+        print(f"You already reach {target_pct:g}% at {company}.")
+        return
+    if np.isnan(plan[0]).all():
+        print(f"{target_pct:g}% at {company} is out of reach even with every feature at its maximum.")
+        return
+    print(f"\nTo reach {target_pct:g}% at {company}, raise one feature:")
+    for f, v, d in zip(feats, x, single[0]):
+        print(f"  {f}: {d:+.2f} ({v:g} -> {v + d:.2f})" if d == d else f"  {f}: not enough on its own")
+    print("or combine smaller increases:")
+    for f, v, d in zip(feats, x, plan[0]):
+        if d > 0:
+            print(f"  {f}: {d:+.2f} ({v:g} -> {v + d:.2f})")
+
+
+def batch_mode(models_dir: str, input_path: str, output_path: str, rejects_path: str = None,
+               company: str = None, target_pct: float = None) -> None:
+    import pandas as pd
+    from .batch import split_valid
+    from .dataio import read_table, write_table
+    from .engine import load_fused
+
+    # Load every company model once, then score the whole cohort in one matmul
+    with profiling.stage('load_models'):
+        engine = load_fused(models_dir, trained_features(models_dir))
+
+    with profiling.stage('read') as s:
+        df = read_table(input_path)
+        s['rows'] = len(df)
+    with profiling.stage('validate', rows=len(df)):
+        valid, rejects = split_valid(df, engine.features)
+    with profiling.stage('score', rows=len(valid)):
+        scores = engine.predict_frame(valid)
+    parts = [scores]
+    if target_pct is not None:
+        if company not in engine.companies:
+            raise SystemExit(f"No trained model for {company} in {models_dir}")
+        # Per-student changes needed to reach the target at one company, in one array pass
+        from .counterfactual import what_it_takes_frame
+        with profiling.stage('what_it_takes', rows=len(valid)):
+            parts.append(what_it_takes_frame(engine, company, valid, target_pct / 100))
+    # Output columns already in the input (e.g. re-scoring a scores file) are replaced
+    written = [c for part in parts for c in part.columns]
+    with profiling.stage('write', rows=len(valid)):
+        write_table(pd.concat([valid.drop(columns=written, errors='ignore'), *parts], axis=1), output_path)
+    print(f"Scored {len(valid)} rows for {len(engine.companies)} companies -> {output_path}")
+
+    if len(rejects):
+        if rejects_path is None:
+            out = Path(output_path)
+            rejects_path = out.with_name(f"{out.stem}_rejected.csv")
+        write_table(rejects, rejects_path)
+        print(f"Skipped {len(rejects)} rows with missing fields -> {rejects_path}")
+
+
 def interactive_mode(models_dir: str):
     print("\n=== MNC Placement Probability Analyzer ===")
     
     while True:
         # Company selection
         print("\nAvailable companies:")
-        companies = list(FEATURES.keys())
+        companies = list(trained_features(models_dir))
         for i, comp in enumerate(companies, 1):
             print(f"{i}. {comp}")
         
@@ -38,7 +132,7 @@ def interactive_mode(models_dir: str):
                 continue
                 
             company = companies[choice - 1]
-            model, features = load_model(models_dir, company)
+            features = load_model(models_dir, company)[1]
             
             # Get user input for each feature
             print(f"\nEnter your details for {company}:")
@@ -53,26 +147,17 @@ def interactive_mode(models_dir: str):
                         print("Please enter a valid number")
             
             # Make prediction
-            df = pd.DataFrame([data])
-            pred = model.predict(df)[0]
-            pct = max(0.0, min(1.0, float(pred))) * 100
+            pct = predict_in_process(models_dir, company, data) * 100
             
             # Show result and suggestions
             print(f"\n=== {company} Readiness: {pct:.2f}% ===")
             
-            # Simple suggestions based on score
-            if pct < 30:
-                print("\nAreas to improve:")
-                print("- Focus on core DSA and problem-solving")
-                print("- Work on personal projects")
-            elif pct < 60:
-                print("\nYou're on the right track!")
-                print("- Practice more coding problems")
-                print("- Consider an internship")
-            else:
-                print("\nGreat job! Keep it up!")
-                print("- Prepare for behavioral interviews")
-                print("- Practice system design")
+            # Suggestions from the shared rule engine
+            from .suggestions import student_advice
+            title, tips = student_advice(company, pct / 100, data)
+            print(f"\n{title}")
+            for tip in tips:
+                print(f"- {tip}")
             
             print("\n" + "="*30)
             
@@ -81,17 +166,45 @@ def interactive_mode(models_dir: str):
 
 
 def main():
+    # The companies and feature flags come from the models that were actually
+    # trained, so --models_dir is read before the full parser is built
+    pre = argparse.ArgumentParser(add_help=False)
+    pre.add_argument('--models_dir', default='models')
+    features = trained_features(pre.parse_known_args()[0].models_dir)
+
     parser = argparse.ArgumentParser(description='Predict company readiness from saved models.')
     parser.add_argument('--company', help='Company name (optional, for non-interactive mode)', 
-                       choices=['Google','Microsoft','Amazon','Infosys'])
+                       choices=list(features))
     parser.add_argument('--models_dir', default='models', help='Directory containing trained models')
+    parser.add_argument('--batch', help='Score every row of a .csv/.xlsx/.parquet file for all companies')
+    parser.add_argument('--output', default='scores.parquet', help='Output path for --batch scores')
+    parser.add_argument('--rejects', help='Where to write rows skipped in --batch (default: <output>_rejected.csv)')
+    parser.add_argument('--target', type=float, help='Target readiness in percent; shows the feature changes needed to reach it')
+    parser.add_argument('--serve', action='store_true', help='Keep models warm behind a Unix socket for later calls')
+    parser.add_argument('--socket', default=default_socket_path(), help='Unix socket used by --serve and detected by normal calls')
     
     # Add feature arguments for non-interactive mode
-    all_features = set(f for feats in FEATURES.values() for f in feats)
+    all_features = set(f for feats in features.values() for f in feats)
     for f in all_features:
-        parser.add_argument(f"--{f.replace(' ', '_')}", type=float, help=f'Value for {f}')
+        parser.add_argument(f"--{f.replace(' ', '_')}", type=float, help=f"Value for {f.replace('%', '%%')}")
+    profiling.add_arguments(parser)
     
     args = parser.parse_args()
+    with profiling.profile_run(args.profile, args.profile_format):
+        run(parser, args)
+
+
+def run(parser, args):
+    if args.serve:
+        from .daemon import run_daemon
+        run_daemon(args.models_dir, args.socket)
+        return
+
+    if args.batch:
+        if args.target is not None and not args.company:
+            parser.error('--target with --batch needs --company')
+        batch_mode(args.models_dir, args.batch, args.output, args.rejects, args.company, args.target)
+        return
     
     # Run in interactive mode if no company specified
     if not args.company:
@@ -100,7 +213,7 @@ def main():
     
     # Non-interactive mode
     try:
-        model, feats = load_model(args.models_dir, args.company)
+        feats = trained_features(args.models_dir)[args.company]
         data = {}
         missing = []
         for f in feats:
@@ -114,10 +227,15 @@ def main():
         if missing:
             raise SystemExit(f"Missing required features for {args.company}: {', '.join(missing)}")
 
-        df = pd.DataFrame([data])
-        pred = model.predict(df)[0]
-        pct = max(0.0, min(1.0, float(pred))) * 100
+        # Hand off to a warm daemon when one is running
+        with profiling.stage('daemon'):
+            readiness = daemon_predict(args.socket, args.models_dir, args.company, data)
+        if readiness is None:
+            readiness = predict_in_process(args.models_dir, args.company, data)
+        pct = readiness * 100
         print(f"Predicted {args.company} Readiness: {pct:.2f}%")
+        if args.target is not None:
+            print_what_it_takes(args.models_dir, args.company, data, args.target)
         
     except Exception as e:
         print(f"Error: {str(e)}")
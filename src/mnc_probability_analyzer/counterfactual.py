@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+
+# Every company model is linear, score = w . x + b, so the change needed to hit a
+# target score has a closed form and a whole cohort is answered with array maths.
+
+# How much of each feature counts as one unit of effort for the combined plan:
+# improving CGPA by 0.5 is treated as about as hard as solving 50 more problems
+EFFORT_UNITS = {
+    'CGPA': 0.5,
+    '10th %': 5,
+    '12th %': 5,
+    'Total Problems Solved': 50,
+    'LeetCode Solved': 50,
+    'Technical Projects': 1,
+    'Internships': 1,
+    'Certifications': 1,
+    'Total Skills': 2,
+    'Teamwork Experience': 1,
+}
+
+# Values a feature can take (default: 0 and up); answers never go past them
+FEATURE_LIMITS = {
+    'CGPA': (0.0, 10.0),
+    '10th %': (0.0, 100.0),
+    '12th %': (0.0, 100.0),
+    'Teamwork Experience': (1.0, 5.0),
+}
+
+
+def what_it_takes(X, coef, intercept: float, target: float, features, effort: dict = EFFORT_UNITS):
+    # X: (students x features) raw values, target in [0, 1]. Only increases of
+    # features with a positive weight count, each up to its FEATURE_LIMITS bound.
+    # Returns
+    #   single: increase of each feature alone that reaches the target (NaN when it cannot)
+    #   plan:   the combined increase with the smallest effort-weighted squared size,
+    #           min sum((d_j / u_j)^2) s.t. w . d = gap, 0 <= d_j <= room_j
+    #           (a whole row is NaN when even every feature at its bound falls short)
+    #   gap:    target minus the current (unclipped) score; <= 0 means already there
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    w = np.asarray(coef, dtype=float)
+    gap = np.maximum(target - (X @ w + intercept), 0.0)
+    hi = np.array([FEATURE_LIMITS.get(f, (0.0, np.inf))[1] for f in features])
+    room = np.where(w > 0, np.maximum(hi - X, 0.0), 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        single = gap[:, None] / w
+    single[(single > room) | ~(w > 0)] = np.nan
+    single[gap == 0] = 0.0
+
+    # Water-filling on the KKT solution d_j = min(lam * w_j * u_j^2, room_j): features
+    # that would pass their bound are fixed there and the rest of the gap goes to
+    # the others. Each round fixes at least one feature, so F + 1 rounds are enough.
+    units = np.array([effort.get(f, 1.0) for f in features], dtype=float)
+    direction = np.where(w > 0, w * units ** 2, 0.0)
+    plan = np.zeros(X.shape)
+    free = (room > 0) & (direction > 0)
+    left = gap.copy()
+    for _ in range(len(w) + 1):
+        norm = free @ (w * direction)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(free, (left / norm)[:, None] * direction, 0.0)
+        over = free & (step > room)
+        if not over.any():
+            break
+        plan[over] = room[over]
+        left -= (np.where(over, room, 0.0) @ w)
+        free &= ~over
+    plan = np.where(free, step, plan)
+    plan[gap == 0] = 0.0
+    # Out of room: even every usable feature at its bound does not close the gap
+    plan[(room @ np.maximum(w, 0.0)) < gap * (1 - 1e-12)] = np.nan
+    return single, plan, gap
+
+
+def what_it_takes_frame(engine, company: str, df: pd.DataFrame, target: float) -> pd.DataFrame:
+    # Cohort version on the fused engine: Need_<feature> for single-feature changes
+    # and Plan_<feature> for the combined plan
+    features = [f for f in engine.features if engine.company_weights(company, [f])[0][0] != 0]
+    coef, intercept = engine.company_weights(company, features)
+    single, plan, _ = what_it_takes(df[features].to_numpy(dtype=float), coef, intercept, target, features)
+    out = pd.DataFrame(single, index=df.index, columns=[f"Need_{f}" for f in features])
+    out[[f"Plan_{f}" for f in features]] = plan
+    return out
+
+
+def response_surface(coef, intercept: float, x, axes, grids) -> np.ndarray:
+    # Readiness over the outer product of grids for the features at positions
+    # axes, with every other feature held at x; one broadcast, no per-point calls
+    coef = np.asarray(coef, dtype=float)
+    x = np.asarray(x, dtype=float)
+    axes = list(axes)
+    total = np.asarray(intercept + coef @ x - coef[axes] @ x[axes])
+    for k, (j, grid) in enumerate(zip(axes, grids)):
+        shape = [1] * len(axes)
+        shape[k] = -1
+        total = total + coef[j] * np.asarray(grid, dtype=float).reshape(shape)
+    return np.clip(total, 0.0, 1.0)
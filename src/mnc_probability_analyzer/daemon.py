@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+from pathlib import Path
+import numpy as np
+
+from .artifact import artifact_path
+from .engine import FusedModel
+from .formulas import trained_features
+from .registry import get_model
+from .serve import MicroBatcher
+
+
+# Line-delimited JSON over a Unix domain socket. Request:
+#   {"models_dir": "...", "company": "Google", "features": {"CGPA": 8.1, ...}}
+# Response: {"readiness": 0.4123} or {"error": "..."}
+
+class Daemon:
+
+    def __init__(self, models_dir: str, max_batch: int = 256, max_wait: float = 0.001):
+        self.models_dir = str(Path(models_dir).resolve())
+        self.batcher = MicroBatcher(None, max_batch, max_wait)
+        self._models = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        # Artifacts go through the registry on every request, so a retrain is
+        # served at once; an unchanged file is a cache hit on its mtime/size and
+        # the fused matrix is only rebuilt when some artifact was reloaded
+        paths = {c: artifact_path(self.models_dir, c) for c in trained_features(self.models_dir)}
+        companies = [c for c, p in paths.items() if p.exists()]
+        models = [get_model(paths[c]) for c in companies]
+        if self._models is not None and len(models) == len(self._models) and all(a is b for a, b in zip(models, self._models)):
+            return
+        self._models = models
+        self.engine = FusedModel.from_models({c: (m['model'], m['features']) for c, m in zip(companies, models)})
+        self.columns = {c: j for j, c in enumerate(self.engine.companies)}
+        self.index = {f: i for i, f in enumerate(self.engine.features)}
+        self.batcher.engine = self.engine
+
+    async def score(self, request: dict) -> dict:
+        if str(Path(request.get('models_dir', '')).resolve()) != self.models_dir:
+            # The client falls back to in-process scoring for other model sets
+            return {'error': f"daemon serves {self.models_dir}"}
+        self.refresh()
+        company = request.get('company')
+        if company not in self.columns:
+            return {'error': f"unknown company {company!r}"}
+        # Features the company does not use have zero weight in its column
+        x = np.zeros((1, len(self.engine.features)))
+        for f, v in request.get('features', {}).items():
+            if f in self.index:
+                x[0, self.index[f]] = float(v)
+        scores = await self.batcher.predict(x)
+        return {'readiness': float(scores[0, self.columns[company]])}
+
+    async def on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self.score(json.loads(line))
+                except (ValueError, TypeError, AttributeError, OSError) as e:
+                    response = {'error': str(e)}
+                writer.write(json.dumps(response).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def _run(daemon: Daemon, socket_path: str) -> None:
+    batcher = asyncio.create_task(daemon.batcher.run())
+    server = await asyncio.start_unix_server(daemon.on_connection, path=socket_path)
+    os.chmod(socket_path, 0o600)
+    # Stop cleanly (and remove the socket file) on SIGTERM as well as Ctrl+C
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, server.close)
+    print(f"Models from {daemon.models_dir} warm on {socket_path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batcher.cancel()
+        Path(socket_path).unlink(missing_ok=True)
+
+
+def _claim_socket(socket_path: str) -> None:
+    # A stale socket file from a crashed daemon would block the bind, but one a
+    # daemon still answers on belongs to that daemon and is left alone
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            Path(socket_path).unlink(missing_ok=True)
+            return
+    raise SystemExit(f"A daemon is already serving on {socket_path}")
+
+
+def run_daemon(models_dir: str, socket_path: str) -> None:
+    _claim_socket(socket_path)
+    try:
+        asyncio.run(_run(Daemon(models_dir), socket_path))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
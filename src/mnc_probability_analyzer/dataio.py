@@ -0,0 +1,235 @@
+import hashlib
+import io
+import json
+import shutil
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+EXCEL_SUFFIXES = {'.xlsx', '.xls'}
+CSV_SUFFIXES = {'.csv'}
+PARQUET_SUFFIXES = {'.parquet', '.pq'}
+ARROW_SUFFIXES = {'.arrow', '.feather'}
+# A directory holding one .npy file per numeric column plus columns.json
+NPY_SUFFIXES = {'.npy'}
+SUPPORTED = '.xlsx, .csv, .parquet, .arrow/.feather or a .npy column bundle'
+
+
+def _suffix(path) -> str:
+    return Path(path).suffix.lower()
+
+
+def file_hash(path) -> str:
+    # SHA-256 of a file's content; a .npy bundle hashes its files in name order
+    path = Path(path)
+    h = hashlib.sha256()
+    for part in sorted(path.iterdir()) if path.is_dir() else [path]:
+        with open(part, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    return h.hexdigest()
+
+
+def keeps_dtypes(path) -> bool:
+    # Only the binary formats store column dtypes; CSV and Excel come back as int64/float64
+    return _suffix(path) in PARQUET_SUFFIXES | ARROW_SUFFIXES | NPY_SUFFIXES
+
+
+def read_table(path, columns=None) -> pd.DataFrame:
+    # Pick the reader from the file extension. With columns, only those that
+    # exist in the file are read; columnar formats skip the rest on disk.
+    suffix = _suffix(path)
+    wanted = None if columns is None else set(columns)
+    if suffix in EXCEL_SUFFIXES:
+        return pd.read_excel(path, usecols=None if wanted is None else (lambda c: c in wanted))
+    if suffix in CSV_SUFFIXES:
+        return pd.read_csv(path, usecols=None if wanted is None else (lambda c: c in wanted))
+    if suffix in PARQUET_SUFFIXES:
+        if wanted is not None:
+            columns = [c for c in table_columns(path) if c in wanted]
+        return pd.read_parquet(path, columns=columns, memory_map=True)
+    if suffix in ARROW_SUFFIXES:
+        import pyarrow as pa
+        # Memory-mapped: only the selected columns' buffers are paged in
+        with pa.memory_map(str(path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        if wanted is not None:
+            table = table.select([c for c in table.column_names if c in wanted])
+        return table.to_pandas(split_blocks=True)
+    if suffix in NPY_SUFFIXES:
+        # Columns come back as read-only memory maps
+        names = table_columns(path)
+        return pd.DataFrame({c: np.load(Path(path) / f"{i}.npy", mmap_mode='r')
+                             for i, c in enumerate(names) if wanted is None or c in wanted}, copy=False)
+    raise ValueError(f"Unsupported file type '{suffix}' for {path} (expected {SUPPORTED})")
+
+
+def read_bytes(data: bytes, name: str) -> pd.DataFrame:
+    # Same dispatch as read_table for in-memory uploads (e.g. from the web app)
+    buffer = io.BytesIO(data)
+    suffix = _suffix(name)
+    if suffix in EXCEL_SUFFIXES:
+        return pd.read_excel(buffer)
+    if suffix in CSV_SUFFIXES:
+        return pd.read_csv(buffer)
+    if suffix in PARQUET_SUFFIXES:
+        return pd.read_parquet(buffer)
+    raise ValueError(f"Unsupported upload type '{suffix}' for {name} (expected .csv, .xlsx or .parquet)")
+
+
+def write_table(df: pd.DataFrame, path) -> None:
+    suffix = _suffix(path)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if suffix in EXCEL_SUFFIXES:
+        df.to_excel(path, index=False)
+    elif suffix in CSV_SUFFIXES:
+        df.to_csv(path, index=False)
+    elif suffix in PARQUET_SUFFIXES:
+        df.to_parquet(path, index=False)
+    elif suffix in ARROW_SUFFIXES:
+        # Uncompressed so readers can memory-map the columns
+        df.reset_index(drop=True).to_feather(path, compression='uncompressed')
+    elif suffix in NPY_SUFFIXES:
+        # One chunk holds every row, so integer columns can keep their own dtype
+        with ChunkWriter(path, promote_ints=False) as writer:
+            writer.write(df)
+    else:
+        raise ValueError(f"Unsupported file type '{suffix}' for {path} (expected {SUPPORTED})")
+
+
+def table_columns(path) -> list:
+    suffix = _suffix(path)
+    if suffix in CSV_SUFFIXES:
+        return list(pd.read_csv(path, nrows=0).columns)
+    if suffix in PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+        return list(pq.ParquetFile(path).schema_arrow.names)
+    if suffix in ARROW_SUFFIXES:
+        import pyarrow as pa
+        with pa.memory_map(str(path)) as source:
+            return list(pa.ipc.open_file(source).schema.names)
+    if suffix in NPY_SUFFIXES:
+        with open(Path(path) / 'columns.json', encoding='utf-8') as f:
+            return json.load(f)['columns']
+    return list(read_table(path).columns)
+
+
+def iter_chunks(path, chunksize: int, columns=None):
+    # Yield DataFrames of at most chunksize rows without loading the whole file
+    suffix = _suffix(path)
+    if suffix in CSV_SUFFIXES:
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns)
+    elif suffix in PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Chunked reading needs a .csv or .parquet file, got '{suffix}' for {path}")
+
+
+class ChunkWriter:
+    # Appends DataFrame chunks to a single .csv, .parquet or .npy bundle. A
+    # column that is all-null in the first chunk has no type yet: it takes its
+    # type from types (column -> NumPy dtype name) or else becomes text, which
+    # every later value can be cast to.
+
+    def __init__(self, path, promote_ints: bool = True, types: dict = None):
+        self.path = Path(path)
+        self.suffix = _suffix(path)
+        if self.suffix not in CSV_SUFFIXES | PARQUET_SUFFIXES | NPY_SUFFIXES:
+            raise ValueError(f"Chunked writing needs a .csv, .parquet or .npy path, got '{self.suffix}' for {path}")
+        self.promote_ints = promote_ints
+        self.types = types or {}
+        self._writer = None
+        self._schema = None
+        self._started = False
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.suffix in CSV_SUFFIXES:
+            df.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+            self._started = True
+            return
+        if self.suffix in NPY_SUFFIXES:
+            if self._writer is None:
+                self._writer = _NpyBundleWriter(self.path, self.promote_ints)
+            self._writer.write(df)
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            fields = []
+            for f in table.schema:
+                if pa.types.is_dictionary(f.type):
+                    # Categoricals: every chunk's categories fit a text dictionary
+                    f = pa.field(f.name, pa.dictionary(pa.int32(), pa.string()))
+                elif df[f.name].isna().all():
+                    dtype = self.types.get(f.name)
+                    f = pa.field(f.name, pa.from_numpy_dtype(np.dtype(dtype)) if dtype else pa.string())
+                elif self.promote_ints and pa.types.is_integer(f.type):
+                    # Integer columns are stored as float64 so a later chunk with
+                    # missing values still fits the schema fixed by the first one
+                    f = pa.field(f.name, pa.float64())
+                fields.append(f)
+            self._schema = pa.schema(fields)
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        # Each chunk is cast to the fixed schema, e.g. ints to float64 or numbers to text
+        self._writer.write_table(table.select(self._schema.names).cast(self._schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class _NpyBundleWriter:
+    # Column data is appended to raw files while the total length is unknown;
+    # close() prepends the .npy headers so readers can memory-map each column
+
+    def __init__(self, path: Path, promote_ints: bool = True):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.promote_ints = promote_ints
+        self.columns = None
+        self.dtypes = None
+        self.rows = 0
+        self._files = []
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.columns is None:
+            # Checked on the pandas dtypes: text and category columns have no NumPy equivalent
+            bad = [str(c) for c, t in df.dtypes.items() if not pd.api.types.is_numeric_dtype(t)]
+            if bad:
+                raise ValueError(f"npy bundles hold numeric columns only; convert or drop {', '.join(bad)}")
+            dtypes = [np.dtype(getattr(t, 'numpy_dtype', t)) for t in df.dtypes]
+            # As for parquet, integers become float64 so later chunks may have gaps
+            self.dtypes = [np.dtype(float) if self.promote_ints and t.kind in 'iu' else t for t in dtypes]
+            self.columns = [str(c) for c in df.columns]
+            self._files = [open(self.path / f"{i}.bin", 'wb') for i in range(len(self.columns))]
+        for f, c, t in zip(self._files, df.columns, self.dtypes):
+            f.write(np.ascontiguousarray(df[c].to_numpy(dtype=t)).tobytes())
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self.columns is None:
+            # Nothing was written, or the first chunk was rejected
+            return
+        for i, (f, t) in enumerate(zip(self._files, self.dtypes)):
+            f.close()
+            raw = self.path / f"{i}.bin"
+            with open(self.path / f"{i}.npy", 'wb') as out, open(raw, 'rb') as src:
+                np.lib.format.write_array_header_1_0(out, {'descr': np.lib.format.dtype_to_descr(t),
+                                                           'fortran_order': False, 'shape': (self.rows,)})
+                shutil.copyfileobj(src, out)
+            raw.unlink()
+        with open(self.path / 'columns.json', 'w', encoding='utf-8') as f:
+            json.dump({'columns': self.columns, 'rows': self.rows}, f)
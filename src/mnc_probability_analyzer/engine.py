@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from .artifact import artifact_path
+from .registry import get_model
+from .schema import feature_matrix
+
+
+class FusedModel:
+    # All company models merged into one coefficient matrix W (features x companies)
+    # and intercept vector b, so scoring N students is a single X @ W + b.
+
+    def __init__(self, companies, features, coef, intercept):
+        self.companies = list(companies)
+        self.features = list(features)
+        self.coef = np.asarray(coef, dtype=float)
+        self.intercept = np.asarray(intercept, dtype=float)
+
+    @classmethod
+    def from_models(cls, models: dict) -> 'FusedModel':
+        # models: {company: (fitted linear model, feature list)}
+        features = list(dict.fromkeys(f for _, feats in models.values() for f in feats))
+        index = {f: i for i, f in enumerate(features)}
+        coef = np.zeros((len(features), len(models)))
+        intercept = np.zeros(len(models))
+        for j, (model, feats) in enumerate(models.values()):
+            coef[[index[f] for f in feats], j] = np.ravel(model.coef_)
+            intercept[j] = float(np.ravel(model.intercept_)[0])
+        return cls(models.keys(), features, coef, intercept)
+
+    def company_weights(self, company: str, features):
+        # One company's coefficients for the given features, plus its intercept
+        j = self.companies.index(company)
+        idx = [self.features.index(f) for f in features]
+        return self.coef[idx, j], float(self.intercept[j])
+
+    def design_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        return feature_matrix(df, self.features)
+
+    def predict(self, X) -> np.ndarray:
+        # Same clip as the single-student CLI path. Compact float32 input is scored
+        # in float32 rather than upcast to a float64 copy of the whole batch
+        X = np.atleast_2d(np.asarray(X))
+        if X.dtype != np.float32:
+            X = X.astype(float, copy=False)
+        coef = self.coef.astype(X.dtype, copy=False)
+        return np.clip(X @ coef + self.intercept.astype(X.dtype, copy=False), 0.0, 1.0)
+
+    def predict_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        scores = self.predict(self.design_matrix(df))
+        return pd.DataFrame(scores, index=df.index, columns=[f"{c}_Readiness" for c in self.companies])
+
+
+def load_fused(models_dir: str, companies) -> FusedModel:
+    # Companies without an artifact (train.py skips those whose inputs are
+    # missing) are left out instead of failing every other company's scores
+    models = {}
+    for company in companies:
+        path = artifact_path(models_dir, company)
+        if path.exists():
+            obj = get_model(path)
+            models[company] = (obj['model'], obj['features'])
+    if not models:
+        raise FileNotFoundError(f"No trained models in {models_dir}; run python -m src.mnc_probability_analyzer.train first")
+    return FusedModel.from_models(models)
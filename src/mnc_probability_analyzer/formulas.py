@@ -0,0 +1,140 @@
+import json
+from pathlib import Path
+
+
+# The one spec behind every readiness number. Each entry is a weighted sum of
+# (scaled) input columns followed by a post step: 'clip' to [0, 1], 'max' to
+# divide by the column maximum, or None to keep the raw sum. preprocess.py
+# writes every entry as a column. An entry with a 'model' also gets a trained
+# model (train.py): its 'features' are the model inputs, and its simulated label
+# is the 'label_weights' sum, divided by its maximum, plus 'noise' Gaussian
+# noise. Adding a company is one more entry here, or in a JSON file of the same
+# shape passed to preprocess.py and train.py with --formulas.
+READINESS_FORMULAS = {
+    'Google_Readiness': {
+        'weights': {'LeetCode Solved': 0.4, 'Technical Projects': 0.3, 'Total Problems Solved': 0.2, 'CGPA': 0.1},
+        'post': 'clip',
+        'model': {'features': ['CGPA', 'Total Problems Solved', 'LeetCode Solved'],
+                  'label_weights': {'CGPA': 0.33, 'Total Problems Solved': 0.30, 'LeetCode Solved': 0.21},
+                  'noise': 0.15},
+    },
+    'Microsoft_Readiness': {
+        'weights': {'Technical Projects': 0.4, 'LeetCode Solved': 0.3, 'Total Problems Solved': 0.2, 'CGPA': 0.1},
+        'post': 'clip',
+        'model': {'features': ['Technical Projects', 'Internships', 'Certifications', 'Total Problems Solved', 'Total Skills'],
+                  'label_weights': {'Technical Projects': 0.2, 'Internships': 0.098, 'Certifications': 0.14,
+                                    'Total Problems Solved': 0.059, 'Total Skills': 0.062},
+                  'noise': 0.12},
+    },
+    'Amazon_Readiness': {
+        'weights': {'LeetCode Solved': 0.35, 'Technical Projects': 0.25, 'Internships': 0.25, 'CGPA': 0.15},
+        'post': 'clip',
+        'model': {'features': ['Technical Projects', 'Internships', 'Certifications', 'LeetCode Solved', 'Teamwork Experience'],
+                  'label_weights': {'Technical Projects': 0.25, 'Internships': 0.15, 'Certifications': 0.18,
+                                    'LeetCode Solved': 0.12, 'Teamwork Experience': 0.10},
+                  'noise': 0.10},
+    },
+    'Infosys_Readiness': {
+        'weights': {'CGPA': 0.3, '10th %': 0.2, '12th %': 0.2, 'Technical Projects': 0.3},
+        'post': 'clip',
+        'model': {'features': ['Internships', 'Technical Projects', 'Certifications', 'LeetCode Solved', 'Teamwork Experience'],
+                  'label_weights': {'Internships': 0.28, 'Technical Projects': 0.20, 'Certifications': 0.14,
+                                    'LeetCode Solved': 0.15, 'Teamwork Experience': 0.10},
+                  'noise': 0.09},
+    },
+}
+
+POST_STEPS = {'clip', 'max', None}
+
+# The spec train.py trained from, written next to the artifacts it saved
+TRAINED_FORMULAS = 'formulas.json'
+
+
+def company_features(formulas: dict = READINESS_FORMULAS) -> dict:
+    # Company name -> model features, for the entries that are trained
+    return {col.removesuffix('_Readiness'): list(spec['model']['features'])
+            for col, spec in formulas.items() if 'model' in spec}
+
+
+def trained_formulas(models_dir) -> dict:
+    # The entries train.py actually fitted into models_dir, with the features it
+    # used; model directories from before the spec was saved fall back to the built-in one
+    path = Path(models_dir) / TRAINED_FORMULAS
+    return load_formulas(path) if path.exists() else READINESS_FORMULAS
+
+
+def trained_features(models_dir) -> dict:
+    return company_features(trained_formulas(models_dir))
+
+
+class FormulaMatrix:
+    # Formulas compiled into one weight matrix W (inputs x outputs), so every
+    # output column for every row is X @ W followed by the per-column post step.
+    # NumPy and pandas are imported in the methods: cli.py builds its flags from
+    # the spec above and must still start without them.
+
+    def __init__(self, names, inputs, weights, post):
+        import numpy as np
+        self.names = list(names)
+        self.inputs = list(inputs)
+        self.weights = np.asarray(weights, dtype=float).reshape(len(self.inputs), len(self.names))
+        self.post = list(post)
+
+    @classmethod
+    def compile(cls, formulas: dict, columns=None) -> 'FormulaMatrix':
+        import numpy as np
+        # Formulas with an input missing from columns are left out, so a partial
+        # dataset still gets the outputs it can support
+        if columns is not None:
+            columns = set(columns)
+            formulas = {name: spec for name, spec in formulas.items() if set(spec['weights']) <= columns}
+        for name, spec in formulas.items():
+            if spec.get('post') not in POST_STEPS:
+                raise ValueError(f"{name}: unknown post step {spec.get('post')!r} (expected 'clip', 'max' or null)")
+        inputs = list(dict.fromkeys(f for spec in formulas.values() for f in spec['weights']))
+        index = {f: i for i, f in enumerate(inputs)}
+        weights = np.zeros((len(inputs), len(formulas)))
+        for j, spec in enumerate(formulas.values()):
+            for f, w in spec['weights'].items():
+                weights[index[f], j] = w
+        return cls(formulas, inputs, weights, [spec.get('post') for spec in formulas.values()])
+
+    def evaluate(self, df):
+        import numpy as np
+        from .schema import feature_matrix
+        X = feature_matrix(df, self.inputs)
+        weights = self.weights.astype(X.dtype, copy=False)
+        missing = np.isnan(X)
+        if missing.any():
+            # A missing input only blanks the outputs that actually use it
+            Y = np.where(missing, X.dtype.type(0), X) @ weights
+            Y[(missing @ (self.weights != 0)) > 0] = np.nan
+        else:
+            Y = X @ weights
+
+        clip = [j for j, p in enumerate(self.post) if p == 'clip']
+        if clip:
+            Y[:, clip] = np.clip(Y[:, clip], 0, 1)
+        for j, p in enumerate(self.post):
+            if p == 'max':
+                top = np.nanmax(Y[:, j]) if len(Y) else 0.0
+                if top > 0:
+                    Y[:, j] /= top
+        return Y
+
+    def apply(self, df):
+        import pandas as pd
+        if self.names:
+            df[self.names] = pd.DataFrame(self.evaluate(df), index=df.index, columns=self.names)
+        return df
+
+
+def load_formulas(path) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_formulas(path, formulas: dict) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(formulas, f, indent=2)
@@ -1,18 +1,32 @@
 import argparse
+import os
+from multiprocessing import Pool
 from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from .dataio import write_table, keeps_dtypes, ChunkWriter, EXCEL_SUFFIXES, ARROW_SUFFIXES
+from .scaling import scaling_path
+from .schema import compact, memory_usage, memory_report
 
-def generate_dummy(output_path: str, n: int = 200, seed: int = 42) -> None:
-    rng = np.random.default_rng(seed)
 
+def _generate_rows(rng: np.random.Generator, n: int, correlated: bool = False) -> pd.DataFrame:
     # Create plausible ranges
-    cgpa = rng.uniform(5.0, 10.0, n)                     # 5-10
-    tenth = rng.uniform(60, 100, n)                      # 60-100
-    twelfth = rng.uniform(60, 100, n)
-    leetcode = rng.integers(0, 400, n)
-    total_problems = leetcode + rng.integers(50, 500, n)
+    if correlated:
+        # A shared latent "aptitude" ties CGPA, LeetCode and total problems together
+        aptitude = rng.standard_normal(n)
+        cgpa = np.clip(7.5 + 1.2 * (0.6 * aptitude + 0.8 * rng.standard_normal(n)), 5.0, 10.0)
+        tenth = rng.uniform(60, 100, n)
+        twelfth = rng.uniform(60, 100, n)
+        leetcode = np.clip(np.rint(200 + 110 * (0.7 * aptitude + 0.71 * rng.standard_normal(n))), 0, 399).astype(np.int64)
+        extra = np.clip(np.rint(275 + 120 * (0.5 * aptitude + 0.87 * rng.standard_normal(n))), 50, 499).astype(np.int64)
+        total_problems = leetcode + extra
+    else:
+        cgpa = rng.uniform(5.0, 10.0, n)                     # 5-10
+        tenth = rng.uniform(60, 100, n)                      # 60-100
+        twelfth = rng.uniform(60, 100, n)
+        leetcode = rng.integers(0, 400, n)
+        total_problems = leetcode + rng.integers(50, 500, n)
     tech_projects = rng.integers(0, 8, n)
     internships = rng.integers(0, 4, n)
     certs = rng.integers(0, 6, n)
@@ -21,7 +35,7 @@ def generate_dummy(output_path: str, n: int = 200, seed: int = 42) -> None:
     teamwork_exp = rng.integers(1, 5, n)
     comm_skills = rng.integers(1, 5, n)
 
-    df = pd.DataFrame({
+    return pd.DataFrame({
         'CGPA': cgpa,
         '10th %': tenth,
         '12th %': twelfth,
@@ -36,16 +50,73 @@ def generate_dummy(output_path: str, n: int = 200, seed: int = 42) -> None:
         'Comm Skills (1-5)': comm_skills,
     })
 
+
+def _shard_rows(n: int, shards: int) -> list:
+    base, rest = divmod(n, shards)
+    return [base + (i < rest) for i in range(shards)]
+
+
+def generate_shard(task) -> pd.DataFrame:
+    # Shard i draws from the i-th child of SeedSequence(seed), so its rows only
+    # depend on (seed, shards, i) and not on which process generated it
+    seed, shards, index, rows, correlated = task
+    if shards == 1:
+        rng = np.random.default_rng(seed)
+    else:
+        rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(shards)[index])
+    return _generate_rows(rng, rows, correlated)
+
+
+def generate_dummy(output_path: str, n: int = 200, seed: int = 42, shards: int = 1,
+                   workers: int = 1, correlated: bool = False, compact_dtypes: bool = True) -> None:
+    memory = [0, 0]
+    if compact_dtypes and not keeps_dtypes(output_path):
+        # CSV and Excel do not store dtypes, so narrowing them would only round values
+        print(f"Keeping float64/int64 columns: {Path(output_path).suffix} files do not store dtypes")
+        compact_dtypes = False
+
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        # Every shard has the same columns and value ranges, so they all get the same dtypes
+        if compact_dtypes:
+            memory[0] += memory_usage(df)
+            compact(df)
+            memory[1] += memory_usage(df)
+        return df
+
+    tasks = [(seed, shards, i, rows, correlated) for i, rows in enumerate(_shard_rows(n, shards))]
+    workers = workers or os.cpu_count() or 1
+
     # Save as a processed-like file that train.py expects
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    df.to_excel(output_path, index=False)
+    if shards == 1 or Path(output_path).suffix.lower() in EXCEL_SUFFIXES | ARROW_SUFFIXES:
+        # Single-shot formats: build the whole frame, then write once
+        df = pd.concat([generate_shard(t) for t in tasks], ignore_index=True) if shards > 1 else generate_shard(tasks[0])
+        write_table(prepare(df), output_path)
+    else:
+        # Shards are appended in order as workers finish them
+        with ChunkWriter(output_path, promote_ints=False) as writer:
+            if workers > 1:
+                with Pool(min(workers, shards)) as pool:
+                    for shard in pool.imap(generate_shard, tasks):
+                        writer.write(prepare(shard))
+            else:
+                for task in tasks:
+                    writer.write(prepare(generate_shard(task)))
+
+    # Values are already raw; drop ranges left behind by an earlier preprocess run
+    scaling_path(output_path).unlink(missing_ok=True)
+    if compact_dtypes:
+        print(memory_report(*memory))
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Generate a dummy processed dataset for training and demos.')
-    parser.add_argument('--output', default='data/processed/final_dataset.xlsx', help='Output .xlsx path')
+    parser.add_argument('--output', default='data/processed/final_dataset.xlsx', help='Output path; .xlsx, .csv, .parquet, .arrow or .npy bundle chosen by extension')
     parser.add_argument('--rows', type=int, default=200, help='Number of rows to generate')
     parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--shards', type=int, default=1, help='Independent seeded substreams; output depends on seed and shards only')
+    parser.add_argument('--workers', type=int, default=1, help='Processes generating shards in parallel (0 = all cores)')
+    parser.add_argument('--correlated', action='store_true', help='Correlate CGPA, LeetCode Solved and Total Problems Solved')
+    parser.add_argument('--no-compact', action='store_true', help='Keep float64/int64 columns instead of the compact schema dtypes')
     args = parser.parse_args()
 
-    generate_dummy(args.output, args.rows, args.seed)
+    generate_dummy(args.output, args.rows, args.seed, args.shards, args.workers, args.correlated, not args.no_compact)
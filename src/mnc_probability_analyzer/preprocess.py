@@ -1,12 +1,34 @@
 import argparse
+import re
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
+
 from pathlib import Path
 
+from .dataio import read_table, write_table, iter_chunks, table_columns, keeps_dtypes, ChunkWriter, NPY_SUFFIXES
+from . import profiling
+from .formulas import READINESS_FORMULAS, FormulaMatrix, load_formulas
+from .scaling import fit_minmax, apply_minmax, compose, save_scaling, scaling_path
+from .schema import SCHEMA, compact, memory_usage, memory_report
+
+
+NUMERIC_COLS = ['CGPA', '10th %', '12th %']
+NORMALIZE_COLS = ['Technical Projects', 'Internships', 'Total Problems Solved', 'CGPA', '10th %', '12th %']
+# Columns the cleaning step reads or fixes; enough for the min/max pass
+RANGE_SOURCE_COLS = ['Full Name', 'LeetCode Solved'] + NORMALIZE_COLS
+
+# A skill is a comma-separated entry that is not blank after str.strip(). The
+# whitespace set is spelled out because the Arrow regex engine's \s is ASCII-only.
+_WHITESPACE = re.escape('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+                        '\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+_SKILL_PATTERN = f"[^,{_WHITESPACE}][^,]*"
+
 
-def preprocess(input_path: str, output_path: str) -> None:
-    df = pd.read_excel(input_path)
+def count_skills(series: pd.Series) -> pd.Series:
+    # Each match runs from an entry's first non-blank character to the next comma
+    return series.fillna('').astype(str).str.count(_SKILL_PATTERN)
 
+
+def clean(df: pd.DataFrame, first_chunk: bool = True) -> pd.DataFrame:
     # Drop direct identifiers / irrelevant columns if present
     for col in ['Email ID', 'SAP ID', 'Timestamp']:
         if col in df.columns:
@@ -16,15 +38,12 @@ def preprocess(input_path: str, output_path: str) -> None:
     tech_col = 'Which technical skills do you have?'
     other_col = 'Other skills: '
     if tech_col in df.columns and other_col in df.columns:
-        def count_skills(series):
-            return series.fillna('').astype(str).apply(
-                lambda x: len([s.strip() for s in x.split(',') if s.strip()])
-            )
-        df['Total Skills'] = count_skills(df[tech_col]) + count_skills(df[other_col])
+        with profiling.stage('count_skills', rows=len(df)):
+            df['Total Skills'] = count_skills(df[tech_col]) + count_skills(df[other_col])
         df = df.drop([tech_col, other_col], axis=1)
 
     # Remove any header-like duplicate first row if present (optional heuristic)
-    if df.shape[0] > 0 and isinstance(df.iloc[0]['Full Name'] if 'Full Name' in df.columns else None, str) and df.iloc[0]['Full Name'] == 'Full Name':
+    if first_chunk and df.shape[0] > 0 and isinstance(df.iloc[0]['Full Name'] if 'Full Name' in df.columns else None, str) and df.iloc[0]['Full Name'] == 'Full Name':
         df = df.iloc[1:].reset_index(drop=True)
 
     # Clean specific columns
@@ -43,58 +62,164 @@ def preprocess(input_path: str, output_path: str) -> None:
             if col in df.columns:
                 df.loc[df['Full Name'] == name, col] = val
 
-    # Normalize selected numeric columns to [0,1]
-    numeric_cols = [c for c in ['CGPA', '10th %', '12th %'] if c in df.columns]
-    for c in numeric_cols:
-        df[c] = pd.to_numeric(df[c], errors='coerce')
-    if numeric_cols:
-        scaler = MinMaxScaler()
-        df[numeric_cols] = scaler.fit_transform(df[numeric_cols])
+    for c in dict.fromkeys(NUMERIC_COLS + NORMALIZE_COLS):
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors='coerce')
+    return df
 
-    # Additional normalization for modeling convenience
-    cols_to_normalize = [c for c in ['Technical Projects', 'Internships', 'Total Problems Solved', 'CGPA', '10th %', '12th %'] if c in df.columns]
+
+def fit_scaling(df: pd.DataFrame) -> list:
+    # Normalize selected numeric columns to [0,1], then a second pass for modeling convenience
+    stages = []
+    numeric_cols = [c for c in NUMERIC_COLS if c in df.columns]
+    if numeric_cols:
+        stages.append(fit_minmax(df, numeric_cols))
+        apply_minmax(df, stages[-1])
+    cols_to_normalize = [c for c in NORMALIZE_COLS if c in df.columns]
     if cols_to_normalize:
-        scaler2 = MinMaxScaler()
-        df[cols_to_normalize] = scaler2.fit_transform(df[cols_to_normalize])
-
-    # Compute readiness proxy features if source columns exist
-    def safe(df, col):
-        return df[col] if col in df.columns else 0
-
-    if {'LeetCode Solved','Technical Projects','Total Problems Solved','CGPA'} <= set(df.columns):
-        df['Google_Readiness'] = (
-            0.4 * df['LeetCode Solved'] +
-            0.3 * df['Technical Projects'] +
-            0.2 * df['Total Problems Solved'] +
-            0.1 * df['CGPA']
-        ).clip(0, 1)
-
-    if {'LeetCode Solved','Technical Projects','Internships','CGPA'} <= set(df.columns):
-        df['Amazon_Readiness'] = (
-            0.35 * df['LeetCode Solved'] +
-            0.25 * df['Technical Projects'] +
-            0.25 * df['Internships'] +
-            0.15 * df['CGPA']
-        ).clip(0, 1)
-
-    if {'CGPA','10th %','12th %','Technical Projects'} <= set(df.columns):
-        df['Infosys_Readiness'] = (
-            0.3 * df['CGPA'] + 0.2 * df['10th %'] + 0.2 * df['12th %'] + 0.3 * df['Technical Projects']
-        ).clip(0, 1)
-
-    if {'Technical Projects','LeetCode Solved','Total Problems Solved','CGPA'} <= set(df.columns):
-        df['Microsoft_Readiness'] = (
-            0.4 * df['Technical Projects'] + 0.3 * df['LeetCode Solved'] + 0.2 * df['Total Problems Solved'] + 0.1 * df['CGPA']
-        ).clip(0, 1)
-
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    df.to_excel(output_path, index=False)
+        stages.append(fit_minmax(df, cols_to_normalize))
+        apply_minmax(df, stages[-1])
+    return stages
+
+
+def add_readiness(df: pd.DataFrame, formulas: dict = READINESS_FORMULAS) -> pd.DataFrame:
+    # Compute readiness proxy features if source columns exist; all of them come
+    # from one matmul over the compiled formula weights. Proxies already in the
+    # input (e.g. re-running on processed output) are dropped first, so they are
+    # replaced rather than duplicated or left stale.
+    df = df.drop(columns=[c for c in formulas if c in df.columns])
+    return FormulaMatrix.compile(formulas, df.columns).apply(df)
+
+
+def _compact_for(output_path: str, compact_dtypes: bool) -> bool:
+    # Narrowed dtypes only survive in parquet/arrow/npy; CSV and Excel would
+    # just store float32-rounded values and be read back as float64
+    if compact_dtypes and not keeps_dtypes(output_path):
+        print(f"Keeping float64/int64 columns: {Path(output_path).suffix} files do not store dtypes")
+        return False
+    return compact_dtypes
+
+
+def _numeric_columns(formulas: dict) -> list:
+    # Columns that are numbers whatever a file or chunk happens to contain
+    return [c for c, t in SCHEMA.items() if t != 'category'] + list(formulas)
+
+
+def _npy_columns(df: pd.DataFrame, numeric: list) -> list:
+    # .npy bundles hold numeric columns only, so text and category columns
+    # (Full Name, Branch, Year, ...) are left out of them
+    keep = [c for c in df.columns if c in numeric or (pd.api.types.is_numeric_dtype(df[c]) and df[c].notna().any())]
+    dropped = [str(c) for c in df.columns if c not in keep]
+    if dropped:
+        print(f"Leaving out columns a .npy bundle cannot hold: {', '.join(dropped)}")
+    return keep
+
+
+def preprocess(input_path: str, output_path: str, formulas: dict = READINESS_FORMULAS,
+               compact_dtypes: bool = True) -> None:
+    compact_dtypes = _compact_for(output_path, compact_dtypes)
+    with profiling.stage('read') as s:
+        df = read_table(input_path)
+        s['rows'] = len(df)
+    with profiling.stage('clean', rows=len(df)):
+        df = clean(df)
+    with profiling.stage('scaling', rows=len(df)):
+        stages = fit_scaling(df)
+    with profiling.stage('readiness', rows=len(df)):
+        df = add_readiness(df, formulas)
+    if compact_dtypes:
+        # Narrow dtypes (schema.SCHEMA) so training and scoring load less memory
+        with profiling.stage('compact', rows=len(df)):
+            before = memory_usage(df)
+            compact(df)
+            print(memory_report(before, memory_usage(df)))
+    if Path(output_path).suffix.lower() in NPY_SUFFIXES:
+        df = df[_npy_columns(df, _numeric_columns(formulas))]
+
+    with profiling.stage('write', rows=len(df)):
+        write_table(df, output_path)
+        # Keep the fitted ranges so training can fold them into the model coefficients
+        save_scaling(scaling_path(output_path), stages)
+
+
+def _merge_ranges(ranges: dict, df: pd.DataFrame) -> None:
+    for c in NORMALIZE_COLS:
+        if c in df.columns:
+            lo, hi = df[c].min(), df[c].max()
+            if pd.isna(lo):
+                continue
+            if c in ranges:
+                lo, hi = min(lo, ranges[c][0]), max(hi, ranges[c][1])
+            ranges[c] = [float(lo), float(hi)]
+
+
+def _staged_ranges(ranges: dict) -> list:
+    # Rebuild both MinMax stages from raw column ranges; the second stage sees
+    # CGPA/10th/12th after the first one, i.e. their ranges mapped through it
+    first = {c: ranges[c] for c in NUMERIC_COLS if c in ranges}
+    affine = compose([first])
+    second = {}
+    for c in NORMALIZE_COLS:
+        if c in first:
+            scale, offset = affine[c]
+            second[c] = [first[c][0] * scale + offset, first[c][1] * scale + offset]
+        elif c in ranges:
+            second[c] = ranges[c]
+    return [stage for stage in (first, second) if stage]
+
+
+def preprocess_stream(input_path: str, output_path: str, chunksize: int = 100_000,
+                      formulas: dict = READINESS_FORMULAS, compact_dtypes: bool = True) -> None:
+    compact_dtypes = _compact_for(output_path, compact_dtypes)
+    # Pass 1 only reads the columns needed to collect the min/max ranges
+    available = table_columns(input_path)
+    range_cols = [c for c in RANGE_SOURCE_COLS if c in available]
+    ranges = {}
+    with profiling.stage('ranges') as s:
+        s['rows'] = 0
+        for i, chunk in enumerate(iter_chunks(input_path, chunksize, columns=range_cols)):
+            _merge_ranges(ranges, clean(chunk, first_chunk=(i == 0)))
+            s['rows'] += len(chunk)
+        stages = _staged_ranges(ranges)
+
+    # Pass 2 transforms and appends one chunk at a time, so memory stays bounded.
+    # Numeric columns keep a float type even when the first chunk has no values.
+    numeric = _numeric_columns(formulas)
+    types = dict.fromkeys(numeric, 'float32' if compact_dtypes else 'float64')
+    npy = Path(output_path).suffix.lower() in NPY_SUFFIXES
+    keep = None
+    with profiling.stage('transform') as s, ChunkWriter(output_path, types=types) as writer:
+        s['rows'] = 0
+        for i, chunk in enumerate(iter_chunks(input_path, chunksize)):
+            chunk = clean(chunk, first_chunk=(i == 0))
+            for stage in stages:
+                apply_minmax(chunk, {c: r for c, r in stage.items() if c in chunk.columns})
+            chunk = add_readiness(chunk, formulas)
+            if compact_dtypes:
+                # No int8: a later chunk could have gaps the first one did not
+                compact(chunk, integers=False)
+            if npy:
+                # The first chunk decides the columns, as it does for the bundle's dtypes
+                keep = keep or _npy_columns(chunk, numeric)
+                chunk = chunk[[c for c in keep if c in chunk.columns]]
+            writer.write(chunk)
+            s['rows'] += len(chunk)
+    save_scaling(scaling_path(output_path), stages)
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Preprocess survey data into a modeling dataset.')
-    parser.add_argument('--input', required=True, help='Path to raw .xlsx file')
-    parser.add_argument('--output', required=True, help='Path to write processed .xlsx file')
+    parser.add_argument('--input', required=True, help='Path to raw .xlsx/.csv/.parquet file')
+    parser.add_argument('--output', required=True, help='Path to write processed .xlsx/.csv/.parquet/.arrow file or .npy bundle (numeric columns only)')
+    parser.add_argument('--chunksize', type=int, help='Stream .csv/.parquet input in chunks of this many rows')
+    parser.add_argument('--formulas', help='JSON file of readiness formulas (default: the built-in proxies)')
+    parser.add_argument('--no-compact', action='store_true', help='Keep float64/int64 columns instead of the compact schema dtypes')
+    profiling.add_arguments(parser)
     args = parser.parse_args()
 
-    preprocess(args.input, args.output)
+    formulas = load_formulas(args.formulas) if args.formulas else READINESS_FORMULAS
+    with profiling.profile_run(args.profile, args.profile_format):
+        if args.chunksize:
+            preprocess_stream(args.input, args.output, args.chunksize, formulas, not args.no_compact)
+        else:
+            preprocess(args.input, args.output, formulas, not args.no_compact)
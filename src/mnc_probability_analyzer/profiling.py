@@ -0,0 +1,120 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is reported as null
+    resource = None
+
+
+# Named pipeline stages with wall time, CPU time, peak RSS and row counts.
+# Code marks stages with `with profiling.stage('read') as s: ...; s['rows'] = len(df)`;
+# until a --profile run enables a Profiler, stage() hands back one shared
+# no-op context manager, so the instrumentation costs a function call per stage.
+
+def _peak_rss():
+    # Process high-water mark so far (ru_maxrss is KiB on Linux, bytes on macOS)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Profiler:
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.stages = []
+        self._depth = 0
+
+    @contextmanager
+    def stage(self, name: str, rows: int = None):
+        record = {'name': name, 'rows': rows, 'depth': self._depth}
+        self._depth += 1
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            self._depth -= 1
+            record['start'] = wall - self.origin
+            record['wall_seconds'] = time.perf_counter() - wall
+            record['cpu_seconds'] = time.process_time() - cpu
+            record['peak_rss_bytes'] = _peak_rss()
+            self.stages.append(record)
+
+    def report(self) -> dict:
+        return {
+            'meta': {
+                'argv': sys.argv,
+                'pid': os.getpid(),
+                'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'total_seconds': time.perf_counter() - self.origin,
+                'cpu_seconds': 'process CPU time (all threads) spent inside the stage',
+                'peak_rss_bytes': 'process peak resident set size at the end of the stage',
+            },
+            'stages': sorted(self.stages, key=lambda r: r['start']),
+        }
+
+    def chrome_trace(self) -> dict:
+        # Trace-event format, viewable in chrome://tracing or ui.perfetto.dev
+        events = [{
+            'name': r['name'], 'cat': 'stage', 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+            'ts': r['start'] * 1e6, 'dur': r['wall_seconds'] * 1e6,
+            'args': {k: r[k] for k in ('rows', 'cpu_seconds', 'peak_rss_bytes')},
+        } for r in self.stages]
+        return {'traceEvents': sorted(events, key=lambda e: e['ts']), 'displayTimeUnit': 'ms'}
+
+    def write(self, path, fmt: str = 'json') -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace() if fmt == 'chrome' else self.report(), f, indent=2)
+
+
+class _NullStage:
+    # Stateless stand-in for a disabled stage. Each `with` gets a fresh dict,
+    # since callers fill in fields such as 'rows' that must not leak into the
+    # next stage or another thread.
+    __slots__ = ()
+
+    def __enter__(self) -> dict:
+        return {}
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_STAGE = _NullStage()
+_active = None
+
+
+def stage(name: str, rows: int = None):
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name, rows)
+
+
+@contextmanager
+def profile_run(path, fmt: str = 'json'):
+    # Enables profiling for the duration of a command and writes the trace at the end
+    global _active
+    if not path:
+        yield None
+        return
+    _active = Profiler()
+    try:
+        yield _active
+    finally:
+        profiler, _active = _active, None
+        profiler.write(path, fmt)
+        print(f"Profile ({len(profiler.stages)} stages) -> {path}")
+
+
+def add_arguments(parser) -> None:
+    parser.add_argument('--profile', metavar='PATH', help='Write wall/CPU time, peak RSS and row counts per stage to this JSON file')
+    parser.add_argument('--profile-format', choices=['json', 'chrome'], default='json',
+                        help='chrome writes trace events for chrome://tracing or Perfetto')
@@ -0,0 +1,69 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from .artifact import load_artifact
+from .dataio import file_hash
+
+
+class ModelRegistry:
+    # LRU of loaded artifacts keyed by resolved path. A cached entry is reused
+    # while the file's mtime/size are unchanged; when they change the content
+    # hash decides whether the artifact really needs to be unpickled again.
+
+    def __init__(self, maxsize: int = 32, loader=load_artifact):
+        self.maxsize = maxsize
+        self.loader = loader
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        path = Path(path).resolve()
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                if entry['stamp'] == stamp:
+                    self.hits += 1
+                    self._entries.move_to_end(path)
+                    return entry['obj']
+                digest = file_hash(path)
+                if digest == entry['hash']:
+                    # Touched but identical content: keep the loaded object
+                    entry['stamp'] = stamp
+                    self.hits += 1
+                    self._entries.move_to_end(path)
+                    return entry['obj']
+                self.reloads += 1
+            else:
+                digest = file_hash(path)
+                self.misses += 1
+
+            obj = self.loader(path)
+            self._entries[path] = {'obj': obj, 'stamp': stamp, 'hash': digest}
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return obj
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'reloads': self.reloads,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+
+# Shared by the CLI and the Streamlit app so each artifact is unpickled once per process
+registry = ModelRegistry()
+
+
+def get_model(path):
+    return registry.get(path)
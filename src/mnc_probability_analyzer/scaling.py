@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+# Min/max normalisation that keeps its fitted ranges, so the scaling applied in
+# preprocessing can be persisted and folded into the saved model coefficients.
+
+def fit_minmax(df: pd.DataFrame, cols) -> dict:
+    return {c: [float(df[c].min()), float(df[c].max())] for c in cols}
+
+
+def _scale_offset(lo: float, hi: float):
+    # Same convention as sklearn's MinMaxScaler: a constant column keeps scale 1
+    rng = hi - lo
+    scale = 1.0 / rng if rng != 0 and np.isfinite(rng) else 1.0
+    return scale, -lo * scale
+
+
+def apply_minmax(df: pd.DataFrame, stats: dict) -> None:
+    for c, (lo, hi) in stats.items():
+        scale, offset = _scale_offset(lo, hi)
+        df[c] = df[c] * scale + offset
+
+
+def compose(stages) -> dict:
+    # Collapse successive min/max stages into one x * scale + offset per column
+    affine = {}
+    for stats in stages:
+        for c, (lo, hi) in stats.items():
+            scale, offset = _scale_offset(lo, hi)
+            prev_scale, prev_offset = affine.get(c, (1.0, 0.0))
+            affine[c] = (prev_scale * scale, prev_offset * scale + offset)
+    return affine
+
+
+def rescale(df: pd.DataFrame, cols, source: dict, target: dict) -> None:
+    # Move columns scaled with one x * s + o map onto another one, in place;
+    # a column without an entry is unscaled on that side
+    for c in cols:
+        s1, o1 = source.get(c, (1.0, 0.0))
+        s2, o2 = target.get(c, (1.0, 0.0))
+        if (s1, o1) != (s2, o2):
+            df[c] = (df[c].astype(float) - o1) / s1 * s2 + o2
+
+
+def fold_affine(features, coef, intercept, affine: dict):
+    # A model fitted on x * s + o equals one on raw x with coef * s and
+    # intercept + coef . o; features without an entry were not scaled
+    coef = np.ravel(np.asarray(coef, dtype=float))
+    scale = np.array([affine.get(f, (1.0, 0.0))[0] for f in features])
+    offset = np.array([affine.get(f, (1.0, 0.0))[1] for f in features])
+    return coef * scale, float(np.ravel(intercept)[0] + coef @ offset)
+
+
+def scaling_path(data_path) -> Path:
+    # Sidecar written next to the processed dataset, e.g. final_dataset.scaling.json
+    return Path(data_path).with_suffix('.scaling.json')
+
+
+def save_scaling(path, stages) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'stages': stages}, f, indent=2)
+
+
+def load_scaling(path) -> list:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['stages']
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+
+# Storage dtypes for the processed dataset. Counts fit in int8/int16, scores and
+# min/max-scaled columns in float32, and the identifier-like columns are stored
+# as categoricals with string categories (parquet only keeps a categorical as
+# one when its categories are strings; int-valued ones come back as int64). A count column that was scaled (or has gaps) is not integral
+# any more and falls back to float32 instead of being rounded.
+SCHEMA = {
+    'CGPA': 'float32',
+    '10th %': 'float32',
+    '12th %': 'float32',
+    'LeetCode Solved': 'int16',
+    'Total Problems Solved': 'int16',
+    'Technical Projects': 'int8',
+    'Internships': 'int8',
+    'Certifications': 'int8',
+    'Total Skills': 'int8',
+    'Public Speaking': 'int8',
+    'Teamwork Experience': 'int8',
+    'Comm Skills (1-5)': 'int8',
+    'Open Source Contribution': 'int8',
+    'Freelancing Experience': 'int8',
+    'Branch': 'category',
+    'Year': 'category',
+}
+
+
+def _dtype_for(col: str, series: pd.Series):
+    target = SCHEMA.get(col)
+    if target is None:
+        # Derived scores (e.g. Google_Readiness) are floats in [0, 1]
+        return 'float32' if col.endswith('_Readiness') and series.dtype == np.float64 else None
+    if target == 'category':
+        return target
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return None
+    if target.startswith('int'):
+        info = np.iinfo(target)
+        values = series.to_numpy()
+        if series.dtype.kind in 'iu' or (series.notna().all() and np.array_equal(values, np.round(values))):
+            if len(values) == 0 or (values.min() >= info.min and values.max() <= info.max):
+                return target
+        return 'float32'
+    return target
+
+
+def _has_text_categories(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.CategoricalDtype) and pd.api.types.is_string_dtype(series.cat.categories)
+
+
+def _as_category(series: pd.Series) -> pd.Series:
+    # Whole-number years become '2', not '2.0'; missing values stay missing
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(series.cat.categories.dtype)
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.dropna().to_numpy(dtype=float)
+        if np.array_equal(values, np.round(values)):
+            series = series.astype('Int64')
+    return series.astype(str).astype('category')
+
+
+def compact(df: pd.DataFrame, integers: bool = True, categories: bool = True) -> pd.DataFrame:
+    # Downcast in place according to SCHEMA. Streaming writers pass integers=False
+    # so every chunk gets the same dtypes whatever its values; categorical chunks
+    # may differ in their categories, which ChunkWriter stores per row group.
+    for col in df.columns:
+        target = _dtype_for(col, df[col])
+        if target == 'category':
+            if categories and not _has_text_categories(df[col]):
+                df[col] = _as_category(df[col])
+            continue
+        if target is None or df[col].dtype == target:
+            continue
+        if target.startswith('int') and not integers:
+            target = 'float32'
+        if target == 'float32' and df[col].dtype.kind == 'f' and df[col].dtype.itemsize < 4:
+            continue
+        df[col] = df[col].astype(target)
+    return df
+
+
+def memory_usage(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def memory_report(before: int, after: int) -> str:
+    saved = 1 - after / before if before else 0.0
+    return f"Memory: {before / 2**20:.1f} MiB -> {after / 2**20:.1f} MiB ({saved:.0%} smaller)"
+
+
+def feature_matrix(df: pd.DataFrame, columns) -> np.ndarray:
+    # 2-D feature array in the narrowest float type that holds every column:
+    # float32 for compact data (int8/int16/float32), float64 otherwise
+    dtypes = [df[c].dtype for c in columns]
+    if all(isinstance(d, np.dtype) and d.kind in 'biuf' for d in dtypes):
+        dtype = np.result_type(np.float32, *dtypes)
+    else:
+        dtype = np.float64
+    return df[list(columns)].to_numpy(dtype=dtype, na_value=np.nan)
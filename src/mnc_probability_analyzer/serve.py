@@ -0,0 +1,212 @@
+import argparse
+import asyncio
+import json
+import math
+import time
+from bisect import bisect_left
+import numpy as np
+
+from .engine import load_fused
+from .formulas import trained_features
+
+
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus style;
+# a final +Inf bucket catches the rest
+LATENCY_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
+
+
+class Histogram:
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.n = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.n += 1
+
+    def snapshot(self) -> dict:
+        bounds = [str(b) for b in self.buckets] + ['+Inf']
+        return {'buckets': dict(zip(bounds, self.counts)), 'count': self.n,
+                'mean': self.total / self.n if self.n else 0.0}
+
+
+class MicroBatcher:
+    # Requests wait in a queue until max_batch of them are pending or the oldest
+    # has waited max_wait seconds; the batch is then scored with one matmul
+
+    def __init__(self, engine, max_batch: int = 256, max_wait: float = 0.002):
+        self.engine = engine
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.batch_sizes = Histogram([1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024])
+        self.queue_latency = Histogram()
+
+    async def predict(self, x: np.ndarray) -> np.ndarray:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((x, future, time.perf_counter()))
+        return await future
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            now = time.perf_counter()
+            X = np.vstack([x for x, _, _ in batch])
+            try:
+                scores = self.engine.predict(X)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            start = 0
+            for x, future, queued_at in batch:
+                self.queue_latency.observe(now - queued_at)
+                if not future.done():
+                    future.set_result(scores[start:start + len(x)])
+                start += len(x)
+            self.batch_sizes.observe(len(X))
+
+
+class PredictionServer:
+
+    def __init__(self, engine, max_batch: int = 256, max_wait: float = 0.002):
+        self.engine = engine
+        self.batcher = MicroBatcher(engine, max_batch, max_wait)
+        self.latency = Histogram()
+        self.requests = 0
+        self.errors = 0
+
+    def rows_from_payload(self, payload) -> np.ndarray:
+        # Accepts one student object or a list; every model feature is required
+        students = payload if isinstance(payload, list) else [payload]
+        if not students:
+            raise ValueError('empty request')
+        X = np.empty((len(students), len(self.engine.features)))
+        for i, student in enumerate(students):
+            if not isinstance(student, dict):
+                raise ValueError('each student must be a JSON object')
+            missing = [f for f in self.engine.features if f not in student]
+            if missing:
+                raise ValueError(f"missing features: {', '.join(missing)}")
+            X[i] = [float(student[f]) for f in self.engine.features]
+        bad = [f for f, ok in zip(self.engine.features, np.isfinite(X).all(axis=0)) if not ok]
+        if bad:
+            raise ValueError(f"non-finite values for: {', '.join(bad)}")
+        return X
+
+    async def predict(self, body: bytes):
+        payload = json.loads(body or b'null')
+        X = self.rows_from_payload(payload)
+        scores = await self.batcher.predict(X)
+        # JSON has no NaN; a score that could not be computed is null
+        results = [{c: v if math.isfinite(v) else None for c, v in zip(self.engine.companies, map(float, row))}
+                   for row in scores]
+        return results if isinstance(payload, list) else results[0]
+
+    def metrics(self) -> dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'queue_depth': self.batcher.queue.qsize(),
+            'latency_seconds': self.latency.snapshot(),
+            'queue_wait_seconds': self.batcher.queue_latency.snapshot(),
+            'batch_size': self.batcher.batch_sizes.snapshot(),
+        }
+
+    async def handle(self, method: str, path: str, body: bytes):
+        if method == 'POST' and path == '/predict':
+            return 200, await self.predict(body)
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics()
+        if method == 'GET' and path == '/health':
+            return 200, {'status': 'ok', 'companies': self.engine.companies, 'features': self.engine.features}
+        return 404, {'error': f'no route for {method} {path}'}
+
+    async def on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Minimal HTTP/1.1 with keep-alive; enough for JSON clients behind a proxy
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0) or 0))
+
+                start = time.perf_counter()
+                self.requests += 1
+                try:
+                    status, result = await self.handle(method, path.split('?', 1)[0], body)
+                except (ValueError, TypeError) as e:
+                    status, result = 400, {'error': str(e)}
+                except Exception as e:
+                    # Anything else is our fault, but the client still gets a JSON answer
+                    status, result = 500, {'error': f"{type(e).__name__}: {e}"}
+                if status >= 400:
+                    self.errors += 1
+                self.latency.observe(time.perf_counter() - start)
+
+                data = json.dumps(result, allow_nan=False).encode('utf-8')
+                keep_alive = headers.get('connection', '').lower() != 'close' and version.strip() == 'HTTP/1.1'
+                reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'}.get(status, '')
+                writer.write(
+                    f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1')
+                    + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(models_dir: str, host: str, port: int, max_batch: int, max_wait: float) -> None:
+    # All company models are loaded once at startup and fused into one matrix
+    server = PredictionServer(load_fused(models_dir, trained_features(models_dir)), max_batch, max_wait)
+    batcher = asyncio.create_task(server.batcher.run())
+    listener = await asyncio.start_server(server.on_connection, host, port)
+    print(f"Serving {', '.join(server.engine.companies)} on http://{host}:{port} (POST /predict, GET /metrics)")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        batcher.cancel()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve readiness predictions over HTTP with micro-batching.')
+    parser.add_argument('--models_dir', default='models', help='Directory containing trained models')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on')
+    parser.add_argument('--max-batch', type=int, default=256, help='Maximum rows scored in one batch')
+    parser.add_argument('--max-wait-ms', type=float, default=2.0, help='Longest a request waits for a batch to fill')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.models_dir, args.host, args.port, args.max_batch, args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        pass
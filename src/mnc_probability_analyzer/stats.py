@@ -0,0 +1,94 @@
+from pathlib import Path
+import numpy as np
+
+
+# Rows upcast to float64 at a time when accumulating from compact (float32) arrays
+BLOCK_ROWS = 65536
+
+
+def cross_products(X, Y):
+    # sum(x), X^T X and X^T Y accumulated in float64. Compact inputs are upcast one
+    # block of rows at a time instead of as a float64 copy of the whole matrix.
+    X = np.asarray(X)
+    Y = np.asarray(Y, dtype=float)
+    step = len(X) if X.dtype == np.float64 else BLOCK_ROWS
+    sum_x = np.zeros(X.shape[1])
+    xtx = np.zeros((X.shape[1], X.shape[1]))
+    xty = np.zeros((X.shape[1],) + Y.shape[1:])
+    for start in range(0, len(X), max(step, 1)):
+        block = np.asarray(X[start:start + step], dtype=float)
+        sum_x += block.sum(axis=0)
+        xtx += block.T @ block
+        xty += block.T @ Y[start:start + step]
+    return sum_x, xtx, xty
+
+
+class SufficientStats:
+    # Running sums that determine an ordinary least-squares fit with intercept:
+    # n, sum(x), sum(y), sum(y^2), X^T X and X^T y. Adding rows is O(rows * F^2)
+    # and solving only touches the F x F system, never the rows themselves.
+
+    def __init__(self, n_features: int):
+        self.n = 0
+        self.sum_x = np.zeros(n_features)
+        self.sum_y = 0.0
+        self.sum_yy = 0.0
+        self.xtx = np.zeros((n_features, n_features))
+        self.xty = np.zeros(n_features)
+
+    @classmethod
+    def from_arrays(cls, X, y) -> 'SufficientStats':
+        X = np.asarray(X)
+        stats = cls(X.shape[1])
+        stats.update(X, y)
+        return stats
+
+    def update(self, X, y) -> 'SufficientStats':
+        y = np.asarray(y, dtype=float)
+        sum_x, xtx, xty = cross_products(X, y)
+        self.n += len(y)
+        self.sum_x += sum_x
+        self.sum_y += float(y.sum())
+        self.sum_yy += float(y @ y)
+        self.xtx += xtx
+        self.xty += xty
+        return self
+
+    def merge(self, other: 'SufficientStats') -> 'SufficientStats':
+        self.n += other.n
+        self.sum_x += other.sum_x
+        self.sum_y += other.sum_y
+        self.sum_yy += other.sum_yy
+        self.xtx += other.xtx
+        self.xty += other.xty
+        return self
+
+    def solve(self):
+        # Centre the normal equations so the intercept drops out, as
+        # LinearRegression does; lstsq copes with constant or collinear columns
+        mean_x = self.sum_x / self.n
+        mean_y = self.sum_y / self.n
+        sxx = self.xtx - self.n * np.outer(mean_x, mean_x)
+        sxy = self.xty - self.n * mean_x * mean_y
+        coef = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        return coef, float(mean_y - mean_x @ coef)
+
+    def save(self, path, **extra) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, n=self.n, sum_x=self.sum_x, sum_y=self.sum_y, sum_yy=self.sum_yy,
+                     xtx=self.xtx, xty=self.xty, **extra)
+
+    @classmethod
+    def load(cls, path):
+        # Returns the statistics plus any extra arrays stored alongside them
+        with np.load(path, allow_pickle=False) as data:
+            stats = cls(len(data['sum_x']))
+            stats.n = int(data['n'])
+            stats.sum_x = data['sum_x'].copy()
+            stats.sum_y = float(data['sum_y'])
+            stats.sum_yy = float(data['sum_yy'])
+            stats.xtx = data['xtx'].copy()
+            stats.xty = data['xty'].copy()
+            extra = {k: data[k] for k in data.files if k not in {'n', 'sum_x', 'sum_y', 'sum_yy', 'xtx', 'xty'}}
+        return stats, extra
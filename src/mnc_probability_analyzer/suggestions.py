@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+
+# Improvement rules from the original Colab export. Every rule owns one bit of a
+# per-student uint32 code, so a whole cohort is evaluated with a few vectorised
+# comparisons and only the codes that are actually shown get turned into text.
+
+LOW, MID = 0.3, 0.6
+
+# Readiness column -> (advice below LOW, advice below MID)
+READINESS_RULES = {
+    'Google_Readiness': ('Improve DSA, Projects, and system design skills',
+                         'Work on DSA, focus more on problem-solving, and contribute to projects'),
+    'Amazon_Readiness': ('Work on Competitive Coding, Improve Internship Experience, and Data Structures',
+                         'Focus on competitive coding, internships, and system design'),
+    'Infosys_Readiness': ('Focus on Academics (CGPA, 10th, 12th), work on more projects, improve technical skills',
+                          'Improve Academics, work on more projects, and focus on coding skills'),
+    'Microsoft_Readiness': ('Focus on Projects, LeetCode practice, and DSA',
+                            'Improve Projects, LeetCode practice, and algorithm knowledge'),
+}
+
+# (column, advice when the value is below this threshold, advice)
+PROFILE_RULES = [
+    ('Comm Skills (1-5)', 4, 'Improve Communication Skills (Focus on clarity and confidence in speaking)'),
+    ('Public Speaking', 4, 'Enhance Public Speaking Skills (Practice presentations, engage in debates)'),
+    ('Teamwork Experience', 3, 'Work on Team Collaboration (Participate in group projects or team-based activities)'),
+    ('Total Skills', 10, 'Broaden Technical and Soft Skills (Expand your project portfolio and collaborate in teams)'),
+]
+
+# Message for each bit, in bit order
+MESSAGES = [m for pair in READINESS_RULES.values() for m in pair] + [m for _, _, m in PROFILE_RULES]
+
+# General tips by readiness tier (below LOW, below MID, above)
+TIERS = [
+    ("Areas to improve:", ['Focus on core DSA and problem-solving', 'Work on personal projects',
+                           'Consider getting certifications', 'Practice coding on platforms like LeetCode']),
+    ("You're on the right track!", ['Practice more coding problems', 'Consider an internship',
+                                    'Work on team projects', 'Improve your problem-solving speed']),
+    ("Great job! Keep it up!", ['Prepare for behavioral interviews', 'Practice system design',
+                                'Keep solving challenging problems', 'Network with professionals']),
+]
+
+
+def readiness_tier(scores) -> np.ndarray:
+    # 0, 1 or 2 per score in [0, 1]; indexes TIERS
+    scores = np.asarray(scores, dtype=float)
+    return np.select([scores < LOW, scores < MID], [0, 1], 2).astype(np.int8)
+
+
+def _values(series: pd.Series) -> np.ndarray:
+    # Compact numeric columns are compared as stored; anything else goes through float
+    values = series.to_numpy()
+    return values if values.dtype.kind in 'iuf' else series.to_numpy(dtype=float, na_value=np.nan)
+
+
+def suggestion_codes(df: pd.DataFrame) -> np.ndarray:
+    # Rules whose column is absent are skipped; missing values never trigger a rule
+    codes = np.zeros(len(df), dtype=np.uint32)
+    for i, col in enumerate(READINESS_RULES):
+        if col in df.columns:
+            values = _values(df[col])
+            codes |= np.select([values < LOW, values < MID], [1 << (2 * i), 1 << (2 * i + 1)], 0).astype(np.uint32)
+    for i, (col, threshold, _) in enumerate(PROFILE_RULES, start=2 * len(READINESS_RULES)):
+        if col in df.columns:
+            codes |= (_values(df[col]) < threshold).astype(np.uint32) << i
+    return codes
+
+
+def render(code: int) -> list:
+    return [m for i, m in enumerate(MESSAGES) if int(code) >> i & 1]
+
+
+def render_codes(codes, empty: str = 'Good to go!') -> np.ndarray:
+    # Text for many students at once; each distinct code is rendered only once
+    unique, inverse = np.unique(np.asarray(codes, dtype=np.uint32), return_inverse=True)
+    texts = np.array(['; '.join(render(c)) or empty for c in unique], dtype=object)
+    return texts[inverse.reshape(-1)]
+
+
+def student_advice(company: str, readiness: float, features: dict):
+    # Heading and bullet points for one student's result, as shown by the CLI and the app
+    row = pd.DataFrame([{**features, f"{company}_Readiness": readiness}])
+    title, tips = TIERS[int(readiness_tier(readiness))]
+    return title, render(suggestion_codes(row)[0]) + tips
@@ -1,65 +1,489 @@
 import argparse
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 import joblib
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import KFold, train_test_split
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
 
+from . import profiling
+from .artifact import load_artifact, load_compact, save_compact
+from .dataio import file_hash, read_table
+from .formulas import (READINESS_FORMULAS, TRAINED_FORMULAS, FormulaMatrix, load_formulas, save_formulas,
+                       trained_formulas)
+from .scaling import compose, fold_affine, load_scaling, rescale, scaling_path
+from .schema import feature_matrix
+from .stats import SufficientStats, cross_products
 
-def train_and_save_models(data_path: str, models_dir: str) -> None:
-    df = pd.read_excel(data_path)
+
+def target_defs(formulas: dict = READINESS_FORMULAS) -> dict:
+    # One model per readiness formula with a 'model' entry (formulas.py): its
+    # features, and the label weights and noise of its simulated label
+    return {col.removesuffix('_Readiness'): {
+                'target': f"{col}_noisy", 'base': col, 'features': list(spec['model']['features']),
+                'weights': spec['model']['label_weights'], 'noise': spec['model']['noise']}
+            for col, spec in formulas.items() if 'model' in spec}
+
+
+TARGET_DEFS = target_defs()
+
+# Identifier columns that are never used as features
+DROP_COLUMNS = ['Full Name', 'Branch', 'Year', 'Suggested_Improvements']
+
+
+def required_columns(target_defs: dict = TARGET_DEFS) -> list:
+    return list(dict.fromkeys(f for spec in target_defs.values() for f in [*spec['features'], *spec['weights']]))
+
+
+def label_formulas(target_defs: dict = TARGET_DEFS) -> dict:
+    # The base readiness behind each simulated label, in formulas.py form; the
+    # raw sums are kept because the training maximum is stored as label_scale
+    return {name: {'weights': spec['weights'], 'post': None} for name, spec in target_defs.items()}
+
+
+def simulate_labels(df: pd.DataFrame, seed: int = None, target_defs: dict = TARGET_DEFS):
+    # Every company's base readiness comes from one matmul and all the noise from
+    # one (rows x companies) draw of a single Generator, so the labels depend only
+    # on the data, the label spec and the seed. Companies with missing inputs are left out.
+    formulas = FormulaMatrix.compile(label_formulas(target_defs), df.columns)
+    bases = formulas.evaluate(df)
+    scales = np.nanmax(bases, axis=0) if len(bases) else np.ones(len(formulas.names))
+    scales = np.where(scales > 0, scales, 1.0)
+    sigma = np.array([target_defs[name]['noise'] for name in formulas.names])
+    noise = np.random.default_rng(seed).normal(0.0, sigma, size=bases.shape)
+    labels = pd.DataFrame(np.clip(bases / scales + noise, 0, 1), index=df.index, columns=formulas.names)
+    return labels, dict(zip(formulas.names, map(float, scales)))
+
+
+def _labels_cache_path(models_dir: str, data_path: str, seed: int, target_defs: dict) -> Path:
+    spec = json.dumps({name: [spec['weights'], spec['noise']] for name, spec in target_defs.items()}, sort_keys=True)
+    key = hashlib.sha256(f"{file_hash(data_path)}:{seed}:{spec}".encode('utf-8')).hexdigest()[:16]
+    return Path(models_dir) / 'cache' / f"labels-{key}.npz"
+
+
+def load_labels(df: pd.DataFrame, data_path: str, models_dir: str, seed: int = None, target_defs: dict = TARGET_DEFS):
+    # Seeded labels are cached by dataset hash, label spec and seed, so a retrain
+    # on unchanged inputs reuses them; unseeded labels are never reused
+    if seed is None:
+        return simulate_labels(df, target_defs=target_defs)
+    path = _labels_cache_path(models_dir, data_path, seed, target_defs)
+    if path.exists():
+        with np.load(path, allow_pickle=False) as data:
+            if data['labels'].shape[0] == len(df):
+                names = [str(n) for n in data['names']]
+                return (pd.DataFrame(data['labels'], index=df.index, columns=names),
+                        dict(zip(names, map(float, data['scales']))))
+    labels, scales = simulate_labels(df, seed, target_defs)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        np.savez(f, labels=labels.to_numpy(), names=np.array(labels.columns, dtype=str), scales=np.array(list(scales.values())))
+    return labels, scales
+
+
+_shared = {}
+
+
+def _init_worker(df: pd.DataFrame, affine: dict, labels: pd.DataFrame, label_scales: dict,
+                 target_defs: dict = TARGET_DEFS) -> None:
+    _shared['df'] = df
+    _shared['affine'] = affine
+    _shared['labels'] = labels
+    _shared['label_scales'] = label_scales
+    _shared['target_defs'] = target_defs
+
+
+def _train_company(name: str, models_dir: str, data_path: str):
+    df, affine, labels = _shared['df'], _shared['affine'], _shared['labels']
+    spec = _shared['target_defs'][name]
+    feats = [f for f in spec['features'] if f in df.columns]
+    if not feats or name not in labels.columns:
+        return None
+    target = labels[name]
+    label_scale = _shared['label_scales'][name]
+
+    X = df[feats]
+    with profiling.stage(f'fit:{name}', rows=len(X)):
+        X_train, X_test, y_train, y_test = train_test_split(X, target, test_size=0.2, random_state=42)
+        model = LinearRegression().fit(X_train, y_train)
+        y_pred = model.predict(X_test)
+        metrics = {'r2': r2_score(y_test, y_pred), 'mae': mean_absolute_error(y_test, y_pred), 'mse': mean_squared_error(y_test, y_pred)}
+
+    # Sufficient statistics of the training rows (pre-folding) so --update can add data later
+    SufficientStats.from_arrays(X_train, y_train).save(
+        _stats_path(models_dir, name), features=np.array(feats), label_scale=label_scale)
+
+    return _finish_company(models_dir, data_path, name, model, feats, affine, metrics, len(X_train), len(X_test))
+
+
+def _finish_company(models_dir: str, data_path: str, name: str, model, feats, affine: dict,
+                    metrics: dict, n_train: int, n_test: int) -> str:
+    model.coef_, model.intercept_ = fold_affine(feats, model.coef_, model.intercept_, affine)
+    _save_artifacts(models_dir, name, model, feats, {
+        'company': name,
+        'target': _shared['target_defs'][name]['target'],
+        'trained_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'data': data_path,
+        'n_train': n_train,
+        'n_test': n_test,
+        'metrics': metrics,
+        'scaling': {f: list(affine[f]) for f in feats if f in affine},
+    })
+    return f"{name}: R2={metrics['r2']:.2f}  MAE={metrics['mae']:.2f}  MSE={metrics['mse']:.2f}"
+
+
+def _train_batched(models_dir: str, data_path: str) -> list:
+    # All companies share the rows and the split (same n, same random_state), so
+    # the design matrix, its Gram matrix and the split are built once and every
+    # company's regression is one slice of a single batched solve
+    df, affine, labels, label_scales = _shared['df'], _shared['affine'], _shared['labels'], _shared['label_scales']
+    defs = _shared['target_defs']
+    names = [n for n in labels.columns if any(f in df.columns for f in defs[n]['features'])]
+    if not names:
+        return []
+    feats = {n: [f for f in defs[n]['features'] if f in df.columns] for n in names}
+    columns = list(dict.fromkeys(f for n in names for f in feats[n]))
+    index = {f: i for i, f in enumerate(columns)}
+    masks = np.zeros((len(names), len(columns)), dtype=bool)
+    for j, n in enumerate(names):
+        masks[j, [index[f] for f in feats[n]]] = True
+
+    Y = labels[names].to_numpy()
+    # Compact (float32) data stays float32 here; the sums below are accumulated in float64
+    X = feature_matrix(df, columns)
+    train_idx, test_idx = train_test_split(np.arange(len(df)), test_size=0.2, random_state=42)
+    X_train, X_test, Y_train, Y_test = X[train_idx], X[test_idx], Y[train_idx], Y[test_idx]
+
+    # Raw sums shared by every company; each company's statistics are a sub-block
+    n_train = len(train_idx)
+    sum_x, xtx, xty = cross_products(X_train, Y_train)
+    sum_y, sum_yy = Y_train.sum(axis=0), (Y_train * Y_train).sum(axis=0)
+
+    # Centred normal equations as in SufficientStats.solve; features a company
+    # does not use get an identity block and a zero right-hand side, so their
+    # coefficients come out as exactly 0
+    mean_x, mean_y = sum_x / n_train, sum_y / n_train
+    sxx = xtx - n_train * np.outer(mean_x, mean_x)
+    sxy = xty - n_train * np.outer(mean_x, mean_y)
+    pair = masks[:, :, None] & masks[:, None, :]
+    A = np.where(pair, sxx, 0.0) + np.eye(len(columns)) * ~masks[:, :, None]
+    rhs = np.where(masks, sxy.T, 0.0)
+    coef = np.einsum('cij,cj->ci', np.linalg.pinv(A, hermitian=True), rhs)
+    intercept = mean_y - coef @ mean_x
+
+    Y_pred = X_test @ coef.T + intercept
+    r2 = r2_score(Y_test, Y_pred, multioutput='raw_values')
+    mae = mean_absolute_error(Y_test, Y_pred, multioutput='raw_values')
+    mse = mean_squared_error(Y_test, Y_pred, multioutput='raw_values')
+
+    lines = []
+    for j, n in enumerate(names):
+        idx = [index[f] for f in feats[n]]
+        stats = SufficientStats(len(idx))
+        stats.n, stats.sum_x, stats.sum_y, stats.sum_yy = n_train, sum_x[idx], float(sum_y[j]), float(sum_yy[j])
+        stats.xtx, stats.xty = xtx[np.ix_(idx, idx)], xty[idx, j]
+        stats.save(_stats_path(models_dir, n), features=np.array(feats[n]), label_scale=label_scales[n])
+
+        # A plain LinearRegression carrying the solved weights, so artifacts match the per-company path
+        model = LinearRegression()
+        model.coef_, model.intercept_ = coef[j, idx], float(intercept[j])
+        model.n_features_in_, model.feature_names_in_ = len(idx), np.array(feats[n], dtype=object)
+        metrics = {'r2': float(r2[j]), 'mae': float(mae[j]), 'mse': float(mse[j])}
+        lines.append(_finish_company(models_dir, data_path, n, model, feats[n], affine, metrics, n_train, len(test_idx)))
+    return lines
+
+
+def _simulate_label(base: pd.Series, spec: dict, rng: np.random.Generator) -> pd.Series:
+    noise = rng.normal(0, spec['noise'], len(base))
+    return (base + noise).clip(0, 1)
+
+
+def _stats_path(models_dir: str, name: str) -> Path:
+    return Path(models_dir) / f"{name.lower()}.stats.npz"
+
+
+def _save_artifacts(models_dir: str, name: str, model, feats, metadata: dict) -> None:
+    with profiling.stage(f'save:{name}'):
+        joblib.dump({'model': model, 'features': feats}, str(Path(models_dir) / f"{name.lower()}.joblib"))
+        save_compact(Path(models_dir) / f"{name.lower()}.npz", feats, model.coef_, model.intercept_, metadata)
+
+
+def _save_trained_formulas(models_dir: str, formulas: dict, trained: dict) -> None:
+    # The entries that got a model, with the features it was actually fitted on;
+    # the CLI, daemon, HTTP service and app serve exactly these
+    spec = {}
+    for col, entry in formulas.items():
+        name = col.removesuffix('_Readiness')
+        if name in trained:
+            spec[col] = {**entry, 'model': {**entry['model'], 'features': trained[name]}}
+    save_formulas(Path(models_dir) / TRAINED_FORMULAS, spec)
+
+
+def train_and_save_models(data_path: str, models_dir: str, scaling: str = None, jobs: int = 1, seed: int = None,
+                          batched: bool = False, formulas: dict = READINESS_FORMULAS) -> None:
+    defs = target_defs(formulas)
+    # Only the feature columns are read; Parquet/Arrow skip everything else on disk
+    with profiling.stage('read') as s:
+        df = read_table(data_path, columns=required_columns(defs))
+        s['rows'] = len(df)
+
+    # Min/max ranges fitted by preprocess.py; folded into the saved coefficients
+    # so the models take raw inputs (CGPA 8.5, 350 problems) at inference time
+    if scaling is None and scaling_path(data_path).exists():
+        scaling = scaling_path(data_path)
+    affine = compose(load_scaling(scaling)) if scaling else {}
 
     # Drop non-feature columns if present
-    drop_columns = [c for c in ['Full Name', 'Branch', 'Year', 'Suggested_Improvements'] if c in df.columns]
+    drop_columns = [c for c in DROP_COLUMNS if c in df.columns]
     if drop_columns:
         df = df.drop(columns=drop_columns)
 
-    target_defs = {
-        'Google':   {'target': 'Google_Readiness_noisy',   'features': ['CGPA', 'Total Problems Solved', 'LeetCode Solved'],
-                     'base': 'Google_Readiness',    'weights': {'CGPA': 0.33, 'Total Problems Solved': 0.30, 'LeetCode Solved': 0.21}, 'noise': 0.15},
-        'Microsoft':{'target': 'Microsoft_Readiness_noisy','features': ['Technical Projects', 'Internships', 'Certifications', 'Total Problems Solved', 'Total Skills'],
-                     'base': 'Microsoft_Readiness', 'weights': {'Technical Projects': 0.2, 'Internships': 0.098, 'Certifications': 0.14, 'Total Problems Solved': 0.059, 'Total Skills': 0.062}, 'noise': 0.12},
-        'Amazon':   {'target': 'Amazon_Readiness_noisy',   'features': ['Technical Projects', 'Internships', 'Certifications', 'LeetCode Solved', 'Teamwork Experience'],
-                     'base': 'Amazon_Readiness',    'weights': {'Technical Projects': 0.25, 'Internships': 0.15, 'Certifications': 0.18, 'LeetCode Solved': 0.12, 'Teamwork Experience': 0.10}, 'noise': 0.10},
-        'Infosys':  {'target': 'Infosys_Readiness_noisy',  'features': ['Internships', 'Technical Projects', 'Certifications', 'LeetCode Solved', 'Teamwork Experience'],
-                     'base': 'Infosys_Readiness',   'weights': {'Internships': 0.28, 'Technical Projects': 0.20, 'Certifications': 0.14, 'LeetCode Solved': 0.15, 'Teamwork Experience': 0.10}, 'noise': 0.09},
+    Path(models_dir).mkdir(parents=True, exist_ok=True)
+
+    # Labels are generated once for all companies before any fitting, so results
+    # do not depend on how companies are spread over workers
+    with profiling.stage('labels', rows=len(df)):
+        labels, label_scales = load_labels(df, data_path, models_dir, seed, defs)
+    tasks = [(name, models_dir, str(data_path)) for name in defs]
+
+    # With --jobs the per-company stages run in worker processes and only this total is traced
+    with profiling.stage('train', rows=len(df)):
+        if batched:
+            _init_worker(df, affine, labels, label_scales, defs)
+            lines = _train_batched(models_dir, str(data_path))
+        elif jobs > 1:
+            # Workers receive the dataset once through the initializer and treat it as read-only
+            with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=_init_worker,
+                                     initargs=(df, affine, labels, label_scales, defs)) as pool:
+                futures = [pool.submit(_train_company, *task) for task in tasks]
+                lines = [f.result() for f in futures]
+        else:
+            _init_worker(df, affine, labels, label_scales, defs)
+            lines = [_train_company(*task) for task in tasks]
+
+    # Same rule as the fits above: a company is trained when it has labels and some feature
+    trained = {name: [f for f in spec['features'] if f in df.columns] for name, spec in defs.items() if name in labels.columns}
+    _save_trained_formulas(models_dir, formulas, {name: feats for name, feats in trained.items() if feats})
+
+    # Printed in spec order regardless of which worker finished first
+    for line in lines:
+        if line:
+            print(line)
+
+
+def _init_cv_worker(df: pd.DataFrame, labels: pd.DataFrame, folds: list, target_defs: dict = TARGET_DEFS) -> None:
+    _init_worker(df, {}, labels, {}, target_defs)
+    _shared['folds'] = folds
+    _shared['design'] = {}
+
+
+def _cv_design(name: str):
+    # Each process converts a company's columns to an array once and reuses it for every fold
+    cache = _shared.setdefault('design', {})
+    if name not in cache:
+        df = _shared['df']
+        feats = [f for f in _shared['target_defs'][name]['features'] if f in df.columns]
+        cache[name] = (feature_matrix(df, feats), _shared['labels'][name].to_numpy())
+    return cache[name]
+
+
+def _cv_fold_stats(name: str, fold: int) -> SufficientStats:
+    X, y = _cv_design(name)
+    rows = _shared['folds'][fold]
+    return SufficientStats.from_arrays(X[rows], y[rows])
+
+
+def _cv_evaluate(name: str, fold: int, train_stats: SufficientStats) -> dict:
+    X, y = _cv_design(name)
+    rows = _shared['folds'][fold]
+    coef, intercept = train_stats.solve()
+    y_true = y[rows]
+    y_pred = X[rows] @ coef + intercept
+    return {'r2': r2_score(y_true, y_pred), 'mae': mean_absolute_error(y_true, y_pred), 'mse': mean_squared_error(y_true, y_pred)}
+
+
+def _markdown_report(report: dict) -> str:
+    meta = report['meta']
+    lines = [f"# Cross-validation: {meta['data']}", '',
+             f"{meta['folds']} folds, {meta['rows']} rows, seed {meta['seed']}, {meta['jobs']} job(s)", '',
+             '| Company | R2 | MAE | MSE |', '| --- | --- | --- | --- |']
+    for name, m in report['companies'].items():
+        lines.append(f"| {name} | " + ' | '.join(f"{m[k]['mean']:.4f} ± {m[k]['std']:.4f}" for k in ('r2', 'mae', 'mse')) + ' |')
+    lines += ['', '| Stage | Seconds |', '| --- | --- |']
+    lines += [f"| {stage} | {seconds:.3f} |" for stage, seconds in report['timings'].items()]
+    return '\n'.join(lines) + '\n'
+
+
+def cross_validate(data_path: str, models_dir: str, k: int = 5, jobs: int = 1, seed: int = None, report_path: str = None,
+                   formulas: dict = READINESS_FORMULAS) -> dict:
+    # Fold indices are computed once; each (company, fold) first summarises its
+    # rows into sufficient statistics, then every fit merges the other k-1
+    # folds' statistics and solves, so no fold's rows are reduced more than once
+    defs = target_defs(formulas)
+    timings = {}
+    start = time.perf_counter()
+    df = read_table(data_path, columns=required_columns(defs))
+    timings['read'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labels, _ = load_labels(df, data_path, models_dir, seed, defs)
+    names = [n for n in defs if n in labels.columns and any(f in df.columns for f in defs[n]['features'])]
+    timings['labels'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    folds = [test for _, test in KFold(n_splits=k, shuffle=True, random_state=42).split(np.arange(len(df)))]
+    timings['folds'] = time.perf_counter() - start
+
+    tasks = [(name, fold) for name in names for fold in range(k)]
+    pool = None
+    if jobs > 1:
+        # Same initializer pattern as training: the dataset is shipped to each worker once
+        pool = ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=_init_cv_worker,
+                                   initargs=(df, labels, folds, defs))
+    _init_cv_worker(df, labels, folds, defs)
+    try:
+        start = time.perf_counter()
+        if pool:
+            fold_stats = list(pool.map(_cv_fold_stats, *zip(*tasks)))
+        else:
+            fold_stats = [_cv_fold_stats(*task) for task in tasks]
+        fold_stats = dict(zip(tasks, fold_stats))
+        timings['fold_stats'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        train_stats = []
+        for name, fold in tasks:
+            merged = SufficientStats(len(fold_stats[name, fold].sum_x))
+            for other in range(k):
+                if other != fold:
+                    merged.merge(fold_stats[name, other])
+            train_stats.append(merged)
+        if pool:
+            results = list(pool.map(_cv_evaluate, *zip(*tasks), train_stats))
+        else:
+            results = [_cv_evaluate(*task, stats) for task, stats in zip(tasks, train_stats)]
+        timings['fit'] = time.perf_counter() - start
+    finally:
+        if pool:
+            pool.shutdown()
+
+    start = time.perf_counter()
+    companies = {}
+    for name in names:
+        per_fold = [r for (n, _), r in zip(tasks, results) if n == name]
+        companies[name] = {metric: {'mean': float(np.mean([r[metric] for r in per_fold])),
+                                    'std': float(np.std([r[metric] for r in per_fold])),
+                                    'folds': [float(r[metric]) for r in per_fold]}
+                           for metric in ('r2', 'mae', 'mse')}
+    report = {
+        'meta': {'data': str(data_path), 'rows': len(df), 'folds': k, 'seed': seed, 'jobs': jobs,
+                 'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds')},
+        'companies': companies,
+        'timings': timings,
     }
+    timings['report'] = time.perf_counter() - start
 
-    # Recompute base readiness (scaled 0-1) then add noise to simulate label
-    import numpy as np
-    for name, spec in target_defs.items():
-        base = spec['base']
-        feats = spec['features']
-        weights = spec['weights']
-        if all(f in df.columns for f in weights.keys()):
-            df[base] = sum(df[f] * w for f, w in weights.items())
-            maxv = df[base].max()
-            if maxv and maxv > 0:
-                df[base] /= maxv
-            noise = np.random.normal(0, spec['noise'], len(df))
-            df[spec['target']] = (df[base] + noise).clip(0, 1)
+    markdown = _markdown_report(report)
+    if report_path:
+        Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            if Path(report_path).suffix.lower() == '.md':
+                f.write(markdown)
+            else:
+                json.dump(report, f, indent=2)
+    print(markdown, end='')
+    return report
 
-    Path(models_dir).mkdir(parents=True, exist_ok=True)
 
-    for name, spec in target_defs.items():
-        feats = [f for f in spec['features'] if f in df.columns]
-        target = spec['target']
-        if not feats or target not in df.columns:
+def update_models(data_path: str, models_dir: str, seed: int = None, scaling: str = None, formulas: dict = None) -> None:
+    # Fold new rows into each company's stored statistics and re-solve the
+    # small normal equations; cost depends on the new rows only. The label spec
+    # defaults to the one the models were trained from.
+    defs = target_defs(formulas if formulas is not None else trained_formulas(models_dir))
+    with profiling.stage('read') as s:
+        df = read_table(data_path, columns=required_columns(defs) + [spec['target'] for spec in defs.values()])
+        s['rows'] = len(df)
+    # preprocess.py fits fresh ranges for every file, so the new rows are mapped
+    # from their own scaling onto the one the stored statistics were built with
+    if scaling is None and scaling_path(data_path).exists():
+        scaling = scaling_path(data_path)
+    new_affine = compose(load_scaling(scaling)) if scaling else {}
+    seeds = np.random.SeedSequence(seed).spawn(len(defs))
+
+    for (name, spec), company_seed in zip(defs.items(), seeds):
+        stats_file = _stats_path(models_dir, name)
+        if not stats_file.exists():
+            print(f"{name}: no saved statistics in {models_dir}, run a full training first")
             continue
-        X = df[feats]
-        y = df[target]
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        model = LinearRegression().fit(X_train, y_train)
-        y_pred = model.predict(X_test)
-        print(f"{name}: R2={r2_score(y_test, y_pred):.2f}  MAE={mean_absolute_error(y_test, y_pred):.2f}  MSE={mean_squared_error(y_test, y_pred):.2f}")
-        joblib.dump({'model': model, 'features': feats}, str(Path(models_dir) / f"{name.lower()}.joblib"))
+        stats, extra = SufficientStats.load(stats_file)
+        feats = [str(f) for f in extra['features']]
+        label_scale = float(extra['label_scale'])
+
+        cols = list(dict.fromkeys(feats + list(spec['weights'])))
+        missing = [c for c in cols if c not in df.columns]
+        if missing:
+            print(f"{name}: skipped, new data lacks {', '.join(missing)}")
+            continue
+        model = load_artifact(Path(models_dir) / f"{name.lower()}.joblib")['model']
+        metadata = load_compact(Path(models_dir) / f"{name.lower()}.npz").metadata
+        affine = {f: tuple(v) for f, v in metadata.get('scaling', {}).items()}
+        rows = df.dropna(subset=cols)
+        rescale(rows, cols, new_affine, affine)
+        if spec['target'] in rows.columns:
+            target = rows[spec['target']]
+        else:
+            # Same recipe as training, normalised by the training-time maximum
+            base = FormulaMatrix.compile(label_formulas({name: spec})).evaluate(rows)[:, 0]
+            target = _simulate_label(pd.Series(base / label_scale, index=rows.index), spec, np.random.default_rng(company_seed))
+        with profiling.stage(f'update:{name}', rows=len(rows)):
+            stats.update(rows[feats], target)
+        stats.save(stats_file, features=np.array(feats), label_scale=label_scale)
+
+        coef, intercept = stats.solve()
+        model.coef_, model.intercept_ = fold_affine(feats, coef, intercept, affine)
+        metadata.update({
+            'updated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'update_data': str(data_path),
+            'n_train': stats.n,
+        })
+        _save_artifacts(models_dir, name, model, feats, metadata)
+        print(f"{name}: added {len(rows)} rows (n_train={stats.n})")
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Train readiness models and save them to disk.')
-    parser.add_argument('--data', required=True, help='Path to processed dataset (.xlsx)')
+    parser.add_argument('--data', help='Path to processed dataset (.xlsx, .csv, .parquet or .arrow)')
     parser.add_argument('--models_dir', default='models', help='Directory to save models')
+    parser.add_argument('--scaling', help='Scaling ranges written by preprocess.py for --data or --update (default: <file>.scaling.json if present)')
+    parser.add_argument('--jobs', type=int, default=1, help='Train companies in parallel on this many processes')
+    parser.add_argument('--seed', type=int, help='Seed for the simulated label noise (default: unseeded); seeded labels are cached in <models_dir>/cache')
+    parser.add_argument('--batched', action='store_true', help='Solve all companies together from one shared design matrix (ignores --jobs)')
+    parser.add_argument('--update', help='Fold new processed rows into the saved models instead of retraining')
+    parser.add_argument('--cv', type=int, metavar='K', help='Evaluate with K-fold cross-validation instead of saving models')
+    parser.add_argument('--report', help='Write the --cv report here (.md for Markdown, otherwise JSON)')
+    parser.add_argument('--formulas', help='JSON file replacing the built-in READINESS_FORMULAS (entries with a "model" are trained)')
+    profiling.add_arguments(parser)
     args = parser.parse_args()
 
-    train_and_save_models(args.data, args.models_dir)
+    if not (args.data or args.update):
+        parser.error('either --data or --update is required')
+    if args.cv is not None and args.cv < 2:
+        parser.error('--cv needs at least 2 folds')
+    if args.update and args.cv is not None:
+        parser.error('--cv evaluates a full --data set and cannot be combined with --update')
+    formulas = load_formulas(args.formulas) if args.formulas else None
+    with profiling.profile_run(args.profile, args.profile_format):
+        if args.cv is not None:
+            with profiling.stage('cross_validate'):
+                cross_validate(args.data, args.models_dir, args.cv, args.jobs, args.seed, args.report,
+                               formulas or READINESS_FORMULAS)
+        elif args.update:
+            update_models(args.update, args.models_dir, args.seed, args.scaling, formulas)
+        else:
+            train_and_save_models(args.data, args.models_dir, args.scaling, args.jobs, args.seed, args.batched,
+                                  formulas or READINESS_FORMULAS)
@@ -0,0 +1,19 @@
+import pytest
+
+from src.mnc_probability_analyzer.generate_dummy import generate_dummy
+from src.mnc_probability_analyzer.train import train_and_save_models
+
+
+@pytest.fixture(scope='session')
+def dataset(tmp_path_factory):
+    # Raw-valued dummy data in compact dtypes, as written by generate_dummy
+    path = tmp_path_factory.mktemp('data') / 'dummy.parquet'
+    generate_dummy(str(path), n=2000, seed=3)
+    return path
+
+
+@pytest.fixture(scope='session')
+def models_dir(tmp_path_factory, dataset):
+    path = tmp_path_factory.mktemp('models')
+    train_and_save_models(str(dataset), str(path), seed=11)
+    return path
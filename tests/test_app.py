@@ -0,0 +1,39 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+AppTest = pytest.importorskip('streamlit.testing.v1').AppTest
+
+APP = Path(__file__).resolve().parents[1] / 'app.py'
+
+
+@pytest.fixture
+def app_dir(tmp_path, models_dir, monkeypatch):
+    # app.py reads ./models; Infosys was listed in the spec but its artifacts are gone
+    shutil.copytree(models_dir, tmp_path / 'models')
+    for path in (tmp_path / 'models').glob('infosys.*'):
+        path.unlink()
+    monkeypatch.syspath_prepend(str(APP.parent))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_home_page_survives_a_missing_company(app_dir):
+    at = AppTest.from_file(str(APP), default_timeout=60).run()
+    assert not at.exception
+    at.button[0].click().run()
+    assert not at.exception and not at.error
+    assert 'Google Readiness' in at.metric[0].label
+
+    at.selectbox[0].select('Infosys').run()
+    at.button[0].click().run()
+    assert not at.exception
+    assert 'not found' in at.error[0].value
+
+
+def test_what_if_explorer_reports_a_broken_artifact(app_dir):
+    (app_dir / 'models' / 'google.npz').write_bytes(b'not a model')
+    at = AppTest.from_file(str(APP), default_timeout=60).run()
+    assert not at.exception
+    assert any('Could not chart Google' in e.value for e in at.error)
@@ -0,0 +1,24 @@
+import pandas as pd
+
+from src.mnc_probability_analyzer.cli import batch_mode
+from src.mnc_probability_analyzer.preprocess import add_readiness
+
+
+def test_add_readiness_replaces_existing_proxies():
+    df = pd.DataFrame({'CGPA': [0.5, 1.0], '10th %': [0.2, 0.4], '12th %': [0.1, 0.3],
+                       'Technical Projects': [0.0, 1.0], 'Google_Readiness': [9.0, 9.0]})
+    out = add_readiness(add_readiness(df))
+    assert out.columns.is_unique
+    # Google's inputs are missing, so the stale value is dropped rather than kept
+    assert 'Google_Readiness' not in out.columns
+    assert out['Infosys_Readiness'].tolist() == add_readiness(df.drop(columns='Google_Readiness'))['Infosys_Readiness'].tolist()
+
+
+def test_batch_rescoring_does_not_duplicate_columns(tmp_path, dataset, models_dir):
+    first, second = tmp_path / 'scores.parquet', tmp_path / 'again.parquet'
+    batch_mode(str(models_dir), str(dataset), str(first))
+    batch_mode(str(models_dir), str(first), str(second))
+    once, twice = pd.read_parquet(first), pd.read_parquet(second)
+    assert twice.columns.is_unique
+    assert list(twice.columns) == list(once.columns)
+    pd.testing.assert_frame_equal(once, twice)
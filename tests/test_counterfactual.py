@@ -0,0 +1,34 @@
+import numpy as np
+
+from src.mnc_probability_analyzer.counterfactual import FEATURE_LIMITS, what_it_takes
+
+FEATURES = ['CGPA', 'LeetCode Solved', 'Technical Projects', 'Teamwork Experience']
+
+
+def _cohort(n=200):
+    rng = np.random.default_rng(0)
+    return np.c_[rng.uniform(5, 10, n), rng.integers(0, 400, n),
+                 rng.integers(0, 8, n), rng.integers(1, 6, n)].astype(float)
+
+
+def test_plan_moves_up_within_limits_and_reaches_target():
+    X = _cohort()
+    w = np.array([0.05, 0.001, -0.02, 0.03])
+    single, plan, gap = what_it_takes(X, w, 0.0, 0.9, FEATURES)
+    assert (plan >= 0).all()
+    # The negatively weighted feature is never moved
+    assert (plan[:, 2] == 0).all() and np.isnan(single[gap > 0][:, 2]).all()
+    after = X + plan
+    assert after[:, 0].max() <= FEATURE_LIMITS['CGPA'][1] + 1e-9
+    assert after[:, 3].max() <= FEATURE_LIMITS['Teamwork Experience'][1] + 1e-9
+    np.testing.assert_allclose(plan @ w, gap, atol=1e-12)
+    assert ((X + np.nan_to_num(single)) <= [10, np.inf, np.inf, 5]).all()
+
+
+def test_unreachable_target_is_reported():
+    X = _cohort()[:, [0, 3]]
+    w = np.array([0.05, 0.03])
+    single, plan, gap = what_it_takes(X, w, 0.0, 0.9, ['CGPA', 'Teamwork Experience'])
+    # Even CGPA 10 and teamwork 5 only give 0.65
+    assert (gap > 0).all()
+    assert np.isnan(plan).all() and np.isnan(single).all()
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.mnc_probability_analyzer.cli import daemon_predict, predict_in_process
+from src.mnc_probability_analyzer.daemon import Daemon, _claim_socket
+from src.mnc_probability_analyzer.train import train_and_save_models
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='needs Unix domain sockets')
+
+STUDENT = {'CGPA': 8.1, 'Total Problems Solved': 420, 'LeetCode Solved': 180}
+
+
+def test_daemon_serves_retrained_models(tmp_path, dataset):
+    models_dir = tmp_path / 'models'
+    train_and_save_models(str(dataset), str(models_dir), seed=1)
+
+    async def run():
+        daemon = Daemon(str(models_dir))
+        request = {'models_dir': str(models_dir), 'company': 'Google', 'features': STUDENT}
+        batcher = asyncio.create_task(daemon.batcher.run())
+        try:
+            first = (await daemon.score(request))['readiness']
+            assert first == pytest.approx(predict_in_process(str(models_dir), 'Google', STUDENT))
+            train_and_save_models(str(dataset), str(models_dir), seed=2)
+            second = (await daemon.score(request))['readiness']
+        finally:
+            batcher.cancel()
+        assert second != first
+        assert second == pytest.approx(predict_in_process(str(models_dir), 'Google', STUDENT))
+
+    asyncio.run(run())
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    path = str(tmp_path / 'stale.sock')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.bind(path)
+    _claim_socket(path)
+    assert not os.path.exists(path)
+
+
+def test_live_daemon_keeps_its_socket(tmp_path, models_dir):
+    path = str(tmp_path / 'd.sock')
+    cmd = [sys.executable, '-m', 'src.mnc_probability_analyzer.cli', '--serve', '--socket', path, '--models_dir', str(models_dir)]
+    daemon = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for _ in range(300):
+            if daemon_predict(path, str(models_dir), 'Google', STUDENT) is not None:
+                break
+            time.sleep(0.05)
+        second = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        assert second.returncode != 0 and 'already serving' in second.stderr
+        assert daemon_predict(path, str(models_dir), 'Google', STUDENT) is not None
+    finally:
+        daemon.terminate()
+        daemon.wait(timeout=10)
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.mnc_probability_analyzer.dataio import ChunkWriter, file_hash, read_table, write_table
+from src.mnc_probability_analyzer.preprocess import preprocess, preprocess_stream
+
+
+def test_parquet_chunks_with_null_first_column(tmp_path):
+    path = tmp_path / 'out.parquet'
+    with ChunkWriter(path, types={'Score': 'float64'}) as writer:
+        writer.write(pd.DataFrame({'Branch': [np.nan, np.nan], 'Score': [None, None], 'n': [1, 2]}))
+        writer.write(pd.DataFrame({'Branch': ['CSE', None], 'Score': [0.5, 1.0], 'n': [3, 4]}))
+    out = read_table(path)
+    assert out['Branch'].tolist()[2] == 'CSE'
+    assert out['Score'].dtype == np.float64
+    assert out['n'].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_stream_preprocess_null_first_text_column(tmp_path, dataset):
+    raw = read_table(dataset).head(1000)
+    raw['Branch'] = np.where(raw.index < 600, None, 'CSE')
+    raw.loc[:300, 'LeetCode Solved'] = np.nan
+    source, out = tmp_path / 'raw.csv', tmp_path / 'processed.parquet'
+    raw.to_csv(source, index=False)
+    preprocess_stream(str(source), str(out), chunksize=250)
+    processed = read_table(out)
+    assert len(processed) == 1000
+    assert (processed['Branch'] == 'CSE').sum() == 400
+    assert processed['LeetCode Solved'].dtype == np.float32
+
+
+def test_year_stays_categorical_in_parquet(tmp_path, dataset):
+    raw = read_table(dataset).head(1000)
+    raw['Year'] = np.where(raw.index % 7 == 0, np.nan, raw.index % 4 + 1)
+    source = tmp_path / 'raw.csv'
+    raw.to_csv(source, index=False)
+    preprocess(str(source), str(tmp_path / 'full.parquet'))
+    preprocess_stream(str(source), str(tmp_path / 'stream.parquet'), chunksize=250)
+    for name in ('full.parquet', 'stream.parquet'):
+        year = read_table(tmp_path / name)['Year']
+        assert isinstance(year.dtype, pd.CategoricalDtype)
+        assert list(year.cat.categories) == ['1', '2', '3', '4']
+        assert year.isna().sum() == 143
+
+
+def test_text_outputs_are_not_compacted(tmp_path, dataset, capsys):
+    source = tmp_path / 'raw.csv'
+    read_table(dataset).head(500).to_csv(source, index=False)
+    preprocess(str(source), str(tmp_path / 'full.csv'))
+    assert 'Memory:' not in capsys.readouterr().out
+    preprocess(str(source), str(tmp_path / 'wide.csv'), compact_dtypes=False)
+    pd.testing.assert_frame_equal(read_table(tmp_path / 'full.csv'), read_table(tmp_path / 'wide.csv'))
+    preprocess_stream(str(source), str(tmp_path / 'stream.csv'), chunksize=200)
+    pd.testing.assert_frame_equal(read_table(tmp_path / 'stream.csv'), read_table(tmp_path / 'wide.csv'))
+    preprocess(str(source), str(tmp_path / 'full.parquet'))
+    assert 'Memory:' in capsys.readouterr().out
+
+
+def test_file_hash_covers_npy_bundles(tmp_path):
+    df = pd.DataFrame({'a': np.arange(5.0), 'b': np.ones(5)})
+    write_table(df, tmp_path / 'one.npy')
+    write_table(df, tmp_path / 'two.npy')
+    assert file_hash(tmp_path / 'one.npy') == file_hash(tmp_path / 'two.npy')
+    df.loc[0, 'a'] = 9.0
+    write_table(df, tmp_path / 'two.npy')
+    assert file_hash(tmp_path / 'one.npy') != file_hash(tmp_path / 'two.npy')
+
+
+def test_npy_bundle_rejects_text_columns_cleanly(tmp_path):
+    df = pd.DataFrame({'CGPA': [8.0, 9.0], 'Full Name': ['A', 'B'], 'Branch': pd.Categorical(['CSE', 'ECE'])})
+    with pytest.raises(ValueError, match='Full Name, Branch'):
+        write_table(df, tmp_path / 'bad.npy')
+    with ChunkWriter(tmp_path / 'empty.npy'):
+        pass
+
+
+@pytest.mark.parametrize('chunksize', [None, 200])
+def test_preprocess_to_npy_leaves_out_text_columns(tmp_path, dataset, chunksize, capsys):
+    raw = read_table(dataset).head(500)
+    raw['Full Name'] = [f"Student {i}" for i in range(len(raw))]
+    raw['Branch'] = 'CSE'
+    raw['Year'] = 3
+    raw.to_csv(tmp_path / 'raw.csv', index=False)
+    out = tmp_path / 'processed.npy'
+    if chunksize:
+        preprocess_stream(str(tmp_path / 'raw.csv'), str(out), chunksize=chunksize)
+    else:
+        preprocess(str(tmp_path / 'raw.csv'), str(out))
+    processed = read_table(out)
+    assert len(processed) == 500 and 'Google_Readiness' in processed
+    assert 'Full Name' not in processed and 'Branch' not in processed
+    assert 'Full Name' in capsys.readouterr().out
@@ -0,0 +1,50 @@
+import shutil
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import train_test_split
+
+from src.mnc_probability_analyzer.dataio import read_table
+from src.mnc_probability_analyzer.engine import load_fused
+from src.mnc_probability_analyzer.formulas import company_features
+from src.mnc_probability_analyzer.registry import registry
+from src.mnc_probability_analyzer.train import simulate_labels, train_and_save_models
+
+FEATURES = company_features()
+
+
+def _sklearn_scores(df, seed):
+    # Reference: one plain float64 LinearRegression per company on the same labels and split
+    labels, _ = simulate_labels(df, seed)
+    scores = {}
+    for name, feats in FEATURES.items():
+        X = df[feats].astype(float)
+        X_train, _, y_train, _ = train_test_split(X, labels[name], test_size=0.2, random_state=42)
+        scores[name] = np.clip(LinearRegression().fit(X_train, y_train).predict(X), 0, 1)
+    return scores
+
+
+def test_fused_engine_matches_sklearn(tmp_path, dataset, models_dir):
+    df = read_table(dataset)
+    expected = _sklearn_scores(df, seed=11)
+    batched_dir = tmp_path / 'batched'
+    train_and_save_models(str(dataset), str(batched_dir), seed=11, batched=True)
+    registry.clear()
+    for trained in (models_dir, batched_dir):
+        scores = load_fused(str(trained), FEATURES).predict_frame(df)
+        for name in FEATURES:
+            np.testing.assert_allclose(scores[f"{name}_Readiness"], expected[name], atol=1e-5)
+
+
+def test_missing_artifact_only_drops_that_company(tmp_path, dataset, models_dir):
+    partial = tmp_path / 'models'
+    shutil.copytree(models_dir, partial)
+    for path in partial.glob('infosys.*'):
+        path.unlink()
+    engine = load_fused(str(partial), FEATURES)
+    assert engine.companies == ['Google', 'Microsoft', 'Amazon']
+    full = load_fused(str(models_dir), FEATURES).predict_frame(read_table(dataset))
+    np.testing.assert_array_equal(engine.predict_frame(read_table(dataset))['Google_Readiness'], full['Google_Readiness'])
+    with pytest.raises(FileNotFoundError):
+        load_fused(str(tmp_path / 'empty'), FEATURES)
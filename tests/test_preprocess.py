@@ -0,0 +1,14 @@
+import sys
+
+import pandas as pd
+
+from src.mnc_probability_analyzer.preprocess import count_skills
+
+
+def test_count_skills_matches_split_and_strip():
+    # Every Unicode whitespace character, as str.strip() in the original lambda sees it
+    spaces = [chr(i) for i in range(sys.maxunicode + 1) if chr(i).isspace()]
+    values = [v for c in spaces for v in (f'a,{c},b', c, f'{c}a{c}', f',{c}x')] + ['', 'a,,b', None]
+    series = pd.Series(values, dtype='str')
+    expected = series.fillna('').apply(lambda x: len([s.strip() for s in x.split(',') if s.strip()]))
+    assert count_skills(series).tolist() == expected.tolist()
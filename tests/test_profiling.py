@@ -0,0 +1,8 @@
+from src.mnc_probability_analyzer import profiling
+
+
+def test_disabled_stages_do_not_share_fields():
+    with profiling.stage('read') as s:
+        s['rows'] = 10
+    with profiling.stage('write') as s:
+        assert s == {}
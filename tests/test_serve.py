@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+import numpy as np
+
+from src.mnc_probability_analyzer.engine import load_fused
+from src.mnc_probability_analyzer.formulas import company_features
+from src.mnc_probability_analyzer.serve import PredictionServer
+
+FEATURES = company_features()
+STUDENT = {f: 1.0 for feats in FEATURES.values() for f in feats}
+
+
+def _post(server, body: bytes):
+    # One request over a real socket; returns (status, parsed JSON body)
+    async def run():
+        batcher = asyncio.create_task(server.batcher.run())
+        listener = await asyncio.start_server(server.on_connection, '127.0.0.1', 0)
+        try:
+            reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+            writer.write(f"POST /predict HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+            response = await reader.read()
+            writer.close()
+        finally:
+            listener.close()
+            batcher.cancel()
+        head, _, payload = response.partition(b'\r\n\r\n')
+        return int(head.split()[1]), json.loads(payload)
+
+    return asyncio.run(run())
+
+
+def test_predict_returns_scores(models_dir):
+    status, result = _post(PredictionServer(load_fused(str(models_dir), FEATURES)), json.dumps(STUDENT).encode())
+    assert status == 200 and set(result) == set(FEATURES)
+
+
+def test_non_finite_input_is_a_client_error(models_dir):
+    status, result = _post(PredictionServer(load_fused(str(models_dir), FEATURES)),
+                           json.dumps({**STUDENT, 'CGPA': float('nan')}).encode())
+    assert status == 400 and 'CGPA' in result['error']
+
+
+def test_nan_scores_are_sent_as_null(models_dir):
+    server = PredictionServer(load_fused(str(models_dir), FEATURES))
+
+    async def nan_scores(X):
+        return np.full((len(X), len(server.engine.companies)), np.nan)
+    server.batcher.predict = nan_scores
+    status, result = _post(server, json.dumps(STUDENT).encode())
+    assert status == 200 and all(v is None for v in result.values())
+
+
+def test_unexpected_error_is_a_json_500(models_dir):
+    server = PredictionServer(load_fused(str(models_dir), FEATURES))
+
+    async def broken(X):
+        raise RuntimeError('engine failed')
+    server.batcher.predict = broken
+    status, result = _post(server, json.dumps(STUDENT).encode())
+    assert status == 500 and 'engine failed' in result['error']
+    assert server.errors == 1
@@ -0,0 +1,92 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from sklearn.model_selection import train_test_split
+
+from src.mnc_probability_analyzer.artifact import load_compact
+from src.mnc_probability_analyzer.dataio import read_table
+from src.mnc_probability_analyzer.formulas import READINESS_FORMULAS, trained_features
+from src.mnc_probability_analyzer.preprocess import preprocess
+from src.mnc_probability_analyzer.train import (TARGET_DEFS, required_columns, simulate_labels, target_defs,
+                                                train_and_save_models, update_models)
+
+
+def _weights(models_dir):
+    return {name: load_compact(models_dir / f"{name.lower()}.npz") for name in TARGET_DEFS}
+
+
+def test_update_with_seen_rows_keeps_coefficients(tmp_path, dataset):
+    raw = read_table(dataset).head(1000)
+    raw.to_csv(tmp_path / 'raw.csv', index=False)
+    preprocess(str(tmp_path / 'raw.csv'), str(tmp_path / 'full.parquet'), compact_dtypes=False)
+    models_dir = tmp_path / 'models'
+    train_and_save_models(str(tmp_path / 'full.parquet'), str(models_dir), seed=5)
+    before = _weights(models_dir)
+
+    # The training rows again, preprocessed on their own so they get different min/max ranges
+    labels, _ = simulate_labels(read_table(tmp_path / 'full.parquet', columns=required_columns()), seed=5)
+    train_idx, _ = train_test_split(np.arange(len(raw)), test_size=0.2, random_state=42)
+    seen = raw.iloc[train_idx].reset_index(drop=True)
+    for name, spec in TARGET_DEFS.items():
+        seen[spec['target']] = labels[name].to_numpy()[train_idx]
+    seen.to_csv(tmp_path / 'seen.csv', index=False)
+    preprocess(str(tmp_path / 'seen.csv'), str(tmp_path / 'seen.parquet'), compact_dtypes=False)
+
+    update_models(str(tmp_path / 'seen.parquet'), str(models_dir))
+    after = _weights(models_dir)
+    for name in TARGET_DEFS:
+        np.testing.assert_allclose(after[name].coef_, before[name].coef_, rtol=1e-8)
+        assert after[name].intercept_ == pytest.approx(before[name].intercept_, abs=1e-10)
+        assert after[name].metadata['n_train'] == 2 * before[name].metadata['n_train']
+
+
+def test_company_comes_from_one_formula_entry(tmp_path, dataset):
+    acme = {'weights': {'CGPA': 1.0}, 'post': 'clip',
+            'model': {'features': ['CGPA', 'Internships'], 'label_weights': {'CGPA': 1.0}, 'noise': 0.0}}
+    formulas = {**READINESS_FORMULAS, 'Acme_Readiness': acme}
+    defs = target_defs(formulas)
+    assert defs['Acme']['features'] == ['CGPA', 'Internships']
+    df = read_table(dataset)
+    labels, scales = simulate_labels(df, seed=0, target_defs=defs)
+    np.testing.assert_allclose(labels['Acme'], df['CGPA'] / df['CGPA'].max(), rtol=1e-6)
+
+    # A company added by a spec file is trained and then served without code changes
+    train_and_save_models(str(dataset), str(tmp_path), seed=0, formulas=formulas)
+    assert trained_features(tmp_path)['Acme'] == ['CGPA', 'Internships']
+    assert load_compact(tmp_path / 'acme.npz').features == ['CGPA', 'Internships']
+
+
+def test_models_keep_their_own_features():
+    # The proxy weights and the model inputs are separate fields of one entry
+    assert TARGET_DEFS['Google']['features'] == ['CGPA', 'Total Problems Solved', 'LeetCode Solved']
+    assert 'Total Skills' in TARGET_DEFS['Microsoft']['features']
+    assert '10th %' not in TARGET_DEFS['Infosys']['features']
+
+
+def test_readme_prediction_example(tmp_path, models_dir):
+    result = subprocess.run([sys.executable, '-m', 'src.mnc_probability_analyzer.cli', '--models_dir', str(models_dir),
+                             '--socket', str(tmp_path / 'none.sock'), '--company', 'Google',
+                             '--CGPA', '8.1', '--Total_Problems_Solved', '350', '--LeetCode_Solved', '120'],
+                            capture_output=True, text=True)
+    assert 'Predicted Google Readiness' in result.stdout, result.stdout + result.stderr
+
+
+def test_only_trained_companies_are_served(tmp_path, dataset):
+    df = read_table(dataset).drop(columns=['Teamwork Experience'])
+    df.to_parquet(tmp_path / 'partial.parquet', index=False)
+    train_and_save_models(str(tmp_path / 'partial.parquet'), str(tmp_path / 'models'), seed=0)
+    # Amazon and Infosys labels need Teamwork Experience, so they get no model and are not served
+    features = trained_features(tmp_path / 'models')
+    assert list(features) == ['Google', 'Microsoft']
+    assert features['Google'] == TARGET_DEFS['Google']['features']
+
+
+@pytest.mark.parametrize('args', [['--update', '{data}', '--cv', '3'], ['--data', '{data}', '--cv', '0'],
+                                  ['--data', '{data}', '--cv', '1']])
+def test_bad_cv_is_rejected(tmp_path, dataset, args):
+    result = subprocess.run([sys.executable, '-m', 'src.mnc_probability_analyzer.train', '--models_dir', str(tmp_path),
+                             *[a.format(data=dataset) for a in args]], capture_output=True, text=True)
+    assert result.returncode == 2
+    assert '--cv' in result.stderr and not list(tmp_path.iterdir())